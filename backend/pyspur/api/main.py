@@ -1,7 +1,5 @@
-import os
 import shutil
 import tempfile
-import threading
 from contextlib import ExitStack, asynccontextmanager
 from importlib.resources import as_file, files
 from pathlib import Path
@@ -13,6 +11,8 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
 
+from ..nodes.llm._utils import close_llm_clients
+from ..nodes.utils.http_client import close_http_client
 from .api_app import api_app
 
 load_dotenv()
@@ -54,6 +54,8 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.error(f"Error stopping socket manager thread: {e}")
 
+    await close_http_client()
+    await close_llm_clients()
     exit_stack.close()
     shutil.rmtree(temporary_static_dir, ignore_errors=True)
 
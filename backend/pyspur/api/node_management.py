@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from ..nodes.factory import NodeFactory
 from ..nodes.llm._utils import LLMModels
+from ..utils.pydantic_utils import get_model_json_schema
 
 router = APIRouter()
 
@@ -23,16 +24,16 @@ async def get_node_types() -> Dict[str, List[Dict[str, Any]]]:
         for node_type in node_types:
             node_class = node_type.node_class
             try:
-                input_schema = node_class.input_model.model_json_schema()
+                input_schema = get_model_json_schema(node_class.input_model)
             except AttributeError:
                 input_schema = {}
             try:
-                output_schema = node_class.output_model.model_json_schema()
+                output_schema = get_model_json_schema(node_class.output_model)
             except AttributeError:
                 output_schema = {}
 
             # Get the config schema and update its title with the display name
-            config_schema = node_class.config_model.model_json_schema()
+            config_schema = get_model_json_schema(node_class.config_model)
             config_schema["title"] = node_type.display_name
             has_fixed_output = node_class.config_model.model_fields["has_fixed_output"].default
 
@@ -41,6 +41,8 @@ from ..utils.workflow_version_utils import fetch_workflow_version
 
 router = APIRouter()
 
+_DATA_URI_HEADER_RE = re.compile(r"data:([^;]+);base64")
+
 
 async def create_run_model(
     workflow_id: str,
@@ -771,12 +773,14 @@ def save_embedded_file(data_uri: str, workflow_id: str) -> str:
 
     Uses file content hash for the filename to avoid duplicates.
     """
-    # Extract the base64 data from the data URI
-    match = re.match(r"data:([^;]+);base64,(.+)", data_uri)
-    if not match:
+    # Extract the base64 data from the data URI. Only the short header goes through the
+    # regex; the payload can be megabytes and is sliced off without scanning it.
+    header, _, base64_data = data_uri.partition(",")
+    match = _DATA_URI_HEADER_RE.fullmatch(header)
+    if not match or not base64_data:
         raise ValueError("Invalid data URI format")
 
-    mime_type, base64_data = match.groups()
+    mime_type = match.group(1)
     file_data = base64.b64decode(base64_data)
 
     # Generate hash from file content
@@ -1,18 +1,17 @@
 # inspired by https://github.com/google-deepmind/gemma/blob/main/colabs/gsm8k_eval.ipynb
-import argparse
 import asyncio
 import importlib.util
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 import yaml
 from datasets import Dataset, load_dataset
-from jinja2 import Template
 
 from ..evals.common import EQUALITY_TEMPLATE, normalize_extracted_answer
 from ..execution.workflow_executor import WorkflowExecutor
+from ..nodes.utils.template_utils import get_template
 from ..schemas.workflow_schemas import WorkflowDefinitionSchema
 
 # Precompiled regular expressions
@@ -134,7 +133,7 @@ def load_yaml_config(yaml_path=None, yaml_config=None, yaml_dir=None, mode="full
 
 def generate_input_prompt(problem: dict, doc_to_text: str, preamble: str) -> str:
     """Generate the input prompt for the model."""
-    question_text = Template(doc_to_text).render(**problem)
+    question_text = get_template(doc_to_text).render(**problem)
     full_prompt = f"{preamble}\n\n{question_text}"
     return full_prompt.strip()
 
@@ -333,7 +332,7 @@ async def evaluate_answer(predicted_answer, ground_truth_answer, evaluation: Dic
 
 def get_ground_truth_answer(problem, doc_to_target):
     """Extracts the ground truth answer using the doc_to_target template."""
-    doc_to_target_template = Template(doc_to_target)
+    doc_to_target_template = get_template(doc_to_target)
     ground_truth = doc_to_target_template.render(**problem)
     return ground_truth.strip()
 
@@ -1,5 +1,6 @@
 import json
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from hashlib import md5
 from typing import Any, Dict, List, Optional, Type, cast
 
@@ -9,6 +10,40 @@ from ..execution.workflow_execution_context import WorkflowExecutionContext
 from ..schemas.workflow_schemas import WorkflowDefinitionSchema
 from ..utils import pydantic_utils
 
+# Maps the simple type names used in output schemas to python types
+_FIELD_TYPE_TO_PYTHON_TYPE: Dict[str, type] = {
+    "string": str,
+    "str": str,
+    "integer": int,
+    "int": int,
+    "number": float,
+    "float": float,
+    "boolean": bool,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "array": list,
+    "object": dict,
+}
+
+
+@lru_cache(maxsize=512)
+def output_model_from_json_schema(
+    output_json_schema: str,
+    model_class_name: str,
+    base_class: Optional[Type["BaseNodeOutput"]] = None,
+) -> Type["BaseNodeOutput"]:
+    """Build the output model for an output JSON schema, on top of base_class.
+
+    Nodes are re-created for every run of a workflow, so the parsed model is shared between
+    nodes with the same name, schema and base class instead of being rebuilt in each setup().
+    base_class defaults to BaseNodeOutput.
+    """
+    schema = json.loads(output_json_schema)
+    return pydantic_utils.json_schema_to_model(  # type: ignore
+        schema, model_class_name=model_class_name, base_class=base_class or BaseNodeOutput
+    )
+
 
 class VisualTag(BaseModel):
     """Pydantic model for visual tag properties."""
@@ -80,9 +115,11 @@ class BaseNode(ABC):
     output_model: Type[BaseNodeOutput]
     input_model: Type[BaseNodeInput]
     _config: BaseNodeConfig
+    _validated_config: Optional[BaseNodeConfig] = None
     _input: BaseNodeInput
     _output: BaseNodeOutput
     visual_tag: VisualTag
+    _default_visual_tag: Optional[VisualTag]
     subworkflow: Optional[WorkflowDefinitionSchema]
     subworkflow_output: Optional[Dict[str, Any]]
 
@@ -107,35 +144,18 @@ class BaseNode(ABC):
         For dynamic schema nodes, these can be created based on self.config.
         """
         if self._config.has_fixed_output:
-            schema = json.loads(self._config.output_json_schema)
-            model = pydantic_utils.json_schema_to_model(
-                schema, model_class_name=self.name, base_class=BaseNodeOutput
+            self.output_model = output_model_from_json_schema(
+                self._config.output_json_schema, self.name
             )
-            self.output_model = model  # type: ignore
 
     def create_output_model_class(self, output_schema: Dict[str, str]) -> Type[BaseNodeOutput]:
         """Dynamically creates an output model based on the node's output schema."""
-        field_type_to_python_type = {
-            "string": str,
-            "str": str,
-            "integer": int,
-            "int": int,
-            "number": float,
-            "float": float,
-            "boolean": bool,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-            "array": list,
-            "object": dict,
-        }
         return create_model(
             f"{self.name}",
             **{
                 field_name: (
-                    (field_type_to_python_type[field_type], ...)
-                    if field_type in field_type_to_python_type
-                    else (field_type, ...)  # try as is
+                    _FIELD_TYPE_TO_PYTHON_TYPE.get(field_type, field_type),  # try as is
+                    ...,
                 )
                 for field_name, field_type in output_schema.items()
             },
@@ -202,10 +222,10 @@ class BaseNode(ABC):
                     model_name=self.input_model.__name__,
                     instances=composite_inputs,  # preserve original keys
                 )
-                data: Dict[str, Any] = {}
-                for key, value in composite_inputs.items():
-                    data[key] = value.model_dump()
-                input = self.input_model.model_validate(data)
+                # The composite fields are typed with the instances' own classes and the
+                # instances were validated when their nodes produced them, so skip the
+                # dump/re-validate round trip
+                input = self.input_model.model_construct(**composite_inputs)
             else:
                 # Input is a dictionary of primitive types
                 self.input_model = pydantic_utils.create_model(
@@ -224,7 +244,11 @@ class BaseNode(ABC):
         result = await self.run(input)
 
         try:
-            output_validated = self.output_model.model_validate(result.model_dump())
+            if type(result) is self.output_model:
+                # Already validated when run() built it
+                output_validated = result
+            else:
+                output_validated = self.output_model.model_validate(result.model_dump())
         except AttributeError:
             output_validated = self.output_model.model_validate(result)
         except Exception as e:
@@ -257,8 +281,13 @@ class BaseNode(ABC):
 
     @property
     def config(self) -> Any:
-        """Return the node's configuration."""
-        return self.config_model.model_validate(self._config.model_dump())
+        """Return the node's configuration, validated against config_model.
+
+        The config is validated on first access and reused until update_config() replaces it.
+        """
+        if self._validated_config is None:
+            self._validated_config = self.config_model.model_validate(self._config.model_dump())
+        return self._validated_config
 
     @property
     def function_schema(self) -> Dict[str, Any]:
@@ -268,7 +297,7 @@ class BaseNode(ABC):
         config fields become function parameters. If has_fixed_output is true,
         both it and output_json_schema are excluded from the parameters.
         """
-        config_schema = self.config_model.model_json_schema()
+        config_schema = pydantic_utils.get_model_json_schema(self.config_model)
 
         # Get description from the node's docstring if available
         description = self.__class__.__doc__ or config_schema.get(
@@ -335,6 +364,7 @@ class BaseNode(ABC):
     def update_config(self, config: BaseNodeConfig) -> None:
         """Update the node's configuration."""
         self._config = config
+        self._validated_config = None
 
     @property
     def input(self) -> Any:
@@ -348,7 +378,15 @@ class BaseNode(ABC):
 
     @classmethod
     def get_default_visual_tag(cls) -> VisualTag:
-        """Set a default visual tag for the node."""
+        """Set a default visual tag for the node.
+
+        The tag only depends on the class, so it is computed once and cached on the class
+        itself. The lookup goes through ``cls.__dict__`` so subclasses never reuse a parent's tag.
+        """
+        cached = cls.__dict__.get("_default_visual_tag")
+        if cached is not None:
+            return cached
+
         # default acronym is the first letter of each word in the node name
         acronym = "".join([word[0] for word in cls.name.split("_")]).upper()
 
@@ -376,4 +414,6 @@ class BaseNode(ABC):
         ]
         color = colors[int(md5(cls.__name__.encode()).hexdigest(), 16) % len(colors)]
 
-        return VisualTag(acronym=acronym, color=color)
+        visual_tag = VisualTag(acronym=acronym, color=color)
+        cls._default_visual_tag = visual_tag
+        return visual_tag
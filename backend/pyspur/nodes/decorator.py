@@ -13,12 +13,12 @@ from typing import (
     runtime_checkable,
 )
 
-from jinja2 import Template
 from pydantic import BaseModel, Field, create_model
 
 from ..execution.workflow_execution_context import WorkflowExecutionContext
 from ..utils.pydantic_utils import json_schema_to_model
 from .base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput, VisualTag
+from .utils.template_utils import get_template
 
 
 class FunctionToolNode(BaseNode):
@@ -72,7 +72,7 @@ class FunctionToolNode(BaseNode):
         # config values can be jinja2 templates so we need to render them
         for param_name, param_value in kwargs.items():
             if isinstance(param_value, str):
-                template = Template(param_value)
+                template = get_template(param_value)
                 kwargs[param_name] = template.render(input=input)
 
         # Call the original function
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, Field
 
@@ -72,6 +72,8 @@ class SendEmailNodeConfig(BaseNodeConfig):
     has_fixed_output: bool = True
     output_json_schema: str = json.dumps(SendEmailNodeOutput.model_json_schema())
 
+    model_config = {"frozen": True}
+
 
 class SendEmailNodeInput(BaseNodeInput):
     """Input for the email node"""
@@ -90,6 +92,14 @@ class SendEmailNode(BaseNode):
     input_model = SendEmailNodeInput
     output_model = SendEmailNodeOutput
 
+    # (rendered field, config template) pairs rendered against the node input
+    _TEMPLATE_FIELDS = (
+        ("from_email", "from_template"),
+        ("to_emails", "to_template"),
+        ("subject", "subject_template"),
+        ("content", "content_template"),
+    )
+
     async def run(self, input: BaseModel) -> BaseModel:
         # Create provider config
         provider_config = EmailProviderConfig()
@@ -99,29 +109,16 @@ class SendEmailNode(BaseNode):
 
         # Render the templates
         raw_input_dict = input.model_dump()
-        from_email = render_template_or_get_first_string(
-            self.config.from_template, raw_input_dict, self.name
-        )
-        to_emails_str = render_template_or_get_first_string(
-            self.config.to_template, raw_input_dict, self.name
-        )
-
-        to_emails = parse_email_addresses(to_emails_str)
-
-        subject = render_template_or_get_first_string(
-            self.config.subject_template, raw_input_dict, self.name
-        )
-        content = render_template_or_get_first_string(
-            self.config.content_template, raw_input_dict, self.name
-        )
+        rendered: Dict[str, Any] = {
+            field: render_template_or_get_first_string(
+                getattr(self.config, template_field), raw_input_dict, self.name
+            )
+            for field, template_field in self._TEMPLATE_FIELDS
+        }
+        rendered["to_emails"] = parse_email_addresses(rendered["to_emails"])
 
         # Create the email message
-        message = EmailMessage(
-            from_email=from_email,
-            to_emails=to_emails,
-            subject=subject,
-            content=content,
-        )
+        message = EmailMessage(**rendered)
 
         # Send the email
         response: EmailResponse = await provider.send_email(message)
@@ -8,7 +8,7 @@ class ExampleNodeConfig(BaseModel):
     Configuration parameters for the ExampleNode.
     """
 
-    pass
+    model_config = {"frozen": True, "extra": "forbid"}
 
 
 class ExampleNodeInput(BaseModel):
@@ -38,8 +38,8 @@ class ExampleNode(BaseNode):
     output_model = ExampleNodeOutput
 
     def setup(self) -> None:
-        self.input_model = ExampleNodeInput
-        self.output_model = ExampleNodeOutput
+        # input/output models are fixed on the class; don't shadow them per instance
+        pass
 
     async def run(self, input_data: ExampleNodeInput) -> ExampleNodeOutput:
         return ExampleNodeOutput(greeting=f"Hello, {input_data.name}!")
@@ -48,6 +48,6 @@ class ExampleNode(BaseNode):
 if __name__ == "__main__":
     import asyncio
 
-    example_node = ExampleNode(ExampleNodeConfig())
+    example_node = ExampleNode(name="example", config=ExampleNodeConfig())
     output = asyncio.run(example_node(ExampleNodeInput(name="Alice")))
     print(output)
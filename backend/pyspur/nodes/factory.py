@@ -1,10 +1,9 @@
-import importlib
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Type
 
-from ..schemas.node_type_schemas import NodeTypeSchema
+from ..schemas.node_type_schemas import NodeTypeSchema, resolve_node_class
 from .base import BaseNode
 from .node_types import (
-    SUPPORTED_NODE_TYPES,
+    SUPPORTED_NODE_TYPE_INDEX,
     get_all_node_types,
     is_valid_node_type,
 )
@@ -28,6 +27,16 @@ class NodeFactory:
     2. Through the legacy configured SUPPORTED_NODE_TYPES in node_types.py
     """
 
+    # Node classes resolved by create_node, keyed by node type name
+    _CLASS_CACHE: Dict[str, Type[BaseNode]] = {}
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop resolved node classes and rediscover registered nodes on next use."""
+        cls._CLASS_CACHE.clear()
+        resolve_node_class.cache_clear()
+        NodeRegistry.invalidate_cache()
+
     @staticmethod
     def get_all_node_types() -> Dict[str, List[NodeTypeSchema]]:
         """Return a dictionary of all available node types grouped by category.
@@ -69,37 +78,24 @@ class NodeFactory:
 
         Checks both registration methods for the node type.
         """
-        if not is_valid_node_type(node_type_name):
-            raise ValueError(f"Node type '{node_type_name}' is not valid.")
-
-        module_name = None
-        class_name = None
-
-        # First check configured nodes
-        for node_group in SUPPORTED_NODE_TYPES.values():
-            for node_type in node_group:
-                if node_type["node_type_name"] == node_type_name:
-                    module_name = node_type["module"]
-                    class_name = node_type["class_name"]
-                    break
-            if module_name and class_name:
-                break
-
-        # If not found, check registry
-        if not module_name or not class_name:
-            registered_nodes = NodeRegistry.get_registered_nodes()
-            for nodes in registered_nodes.values():
-                for node in nodes:
-                    if node.node_type_name == node_type_name:
-                        module_name = node.module
-                        class_name = node.class_name
-                        break
-                if module_name and class_name:
-                    break
-
-        if not module_name or not class_name:
-            raise ValueError(f"Node type '{node_type_name}' not found.")
-
-        module = importlib.import_module(module_name, package="pyspur")
-        node_class = getattr(module, class_name)
+        node_class = NodeFactory._CLASS_CACHE.get(node_type_name)
+        if node_class is None:
+            node_class = NodeFactory._resolve_node_class(node_type_name)
+            NodeFactory._CLASS_CACHE[node_type_name] = node_class
         return node_class(name=node_name, config=node_class.config_model(**config))
+
+    @staticmethod
+    def _resolve_node_class(node_type_name: str) -> Type[BaseNode]:
+        """Find the module and class registered for a node type and import it."""
+        # First check configured nodes, then the registry
+        entry = SUPPORTED_NODE_TYPE_INDEX.get(node_type_name)
+        if entry is None:
+            node_info = NodeRegistry.get_node_info(node_type_name)
+            if node_info is None:
+                if not is_valid_node_type(node_type_name):
+                    raise ValueError(f"Node type '{node_type_name}' is not valid.")
+                raise ValueError(f"Node type '{node_type_name}' not found.")
+            entry = (node_info.module, node_info.class_name)
+
+        module_name, class_name = entry
+        return resolve_node_class(module_name, class_name)
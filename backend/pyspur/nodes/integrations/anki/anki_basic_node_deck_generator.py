@@ -4,11 +4,11 @@ import random
 from typing import Any, Dict, List, Optional
 
 import genanki
-from jinja2 import Template
 from pydantic import BaseModel, Field
 from typing_extensions import TypeAlias
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ...utils.template_utils import get_template
 
 # Type aliases for genanki types to help with type checking
 GenkaniModel: TypeAlias = Any  # genanki.Model
@@ -88,7 +88,7 @@ class AnkiBasicNode(BaseNode):
     def _render_template(self, template_str: str, data: Dict[str, Any]) -> str:
         """Render a Jinja template string with the provided data."""
         try:
-            return Template(template_str).render(**data)
+            return get_template(template_str).render(**data)
         except Exception as e:
             print(f"[ERROR] Failed to render template in {self.name}")
             print(f"[ERROR] Template: {template_str}")
@@ -0,0 +1,74 @@
+import asyncio
+import os
+from typing import Any, Callable, Optional, TypeVar
+
+from firecrawl import FirecrawlApp  # type: ignore
+from pydantic import BaseModel
+
+from ...utils.rate_limiter import AdaptiveConcurrencyLimiter, get_rate_limiter
+from ...utils.retry import retry_transient_errors
+from ...utils.template_utils import get_template_context, render_template_or_get_first_string
+
+# Request params that never change; firecrawl copies params into the request body
+SCRAPE_PARAMS = {"formats": ("markdown",)}
+SCRAPE_WITH_HTML_PARAMS = {"formats": ("markdown", "html")}
+CRAWL_SCRAPE_OPTIONS = {"formats": ("markdown", "html")}
+
+T = TypeVar("T")
+
+_firecrawl_app: Optional[FirecrawlApp] = None
+
+
+def get_firecrawl_app() -> FirecrawlApp:
+    """Return the FirecrawlApp shared by the Firecrawl nodes.
+
+    The app is rebuilt only when the API key or URL in the environment changes, e.g. after
+    the key is updated through the key management API.
+    """
+    global _firecrawl_app
+    api_key = os.getenv("FIRECRAWL_API_KEY")
+    api_url = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev")
+    if (
+        _firecrawl_app is None
+        or _firecrawl_app.api_key != api_key
+        or _firecrawl_app.api_url != api_url
+    ):
+        _firecrawl_app = FirecrawlApp(api_key=api_key, api_url=api_url)  # type: ignore
+    return _firecrawl_app
+
+
+def get_firecrawl_limiter() -> AdaptiveConcurrencyLimiter:
+    """Return the limiter that every Firecrawl API call goes through.
+
+    Firecrawl enforces per-plan rate limits, so the allowed concurrency backs off when it
+    answers with 429 and grows again while calls succeed.
+    """
+    return get_rate_limiter("firecrawl")
+
+
+async def call_firecrawl_once(method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call a FirecrawlApp method through the Firecrawl limiter, without retrying it.
+
+    For calls that are not safe to repeat, such as starting a crawl: a timeout or 5xx may
+    come after Firecrawl accepted the request, and a retry would start (and bill) another
+    one. FirecrawlApp is synchronous, so the call runs in a worker thread to keep the event
+    loop free.
+    """
+    async with get_firecrawl_limiter():
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+
+@retry_transient_errors
+async def call_firecrawl(method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call a FirecrawlApp method through the Firecrawl limiter, retrying transient failures.
+
+    Only for calls that are safe to repeat, such as scraping a page or checking a crawl's
+    status. Transient failures (429s, 5xx, timeouts) are retried with backoff.
+    """
+    return await call_firecrawl_once(method, *args, **kwargs)
+
+
+def render_url_template(url_template: str, input: BaseModel, node_name: str) -> str:
+    """Render a Firecrawl node's URL template against its input."""
+    context = get_template_context(input, url_template)
+    return render_template_or_get_first_string(url_template, context, node_name)
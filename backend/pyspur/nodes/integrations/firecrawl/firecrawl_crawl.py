@@ -3,10 +3,9 @@ import json
 import logging
 from typing import Optional
 
+import orjson
 from pydantic import BaseModel, Field  # type: ignore
 
-from firecrawl import FirecrawlApp  # type: ignore
-
 from ...base import (
     BaseNode,
     BaseNodeConfig,
@@ -14,7 +13,16 @@ from ...base import (
     BaseNodeOutput,
 )
 from ...registry import NodeRegistry
-from ...utils.template_utils import render_template_or_get_first_string
+from ...utils.template_utils import get_template, get_template_variables
+from ._common import (
+    CRAWL_SCRAPE_OPTIONS,
+    call_firecrawl,
+    call_firecrawl_once,
+    get_firecrawl_app,
+    render_url_template,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class FirecrawlCrawlNodeInput(BaseNodeInput):
@@ -63,26 +71,26 @@ class FirecrawlCrawlNode(BaseNode):
     output_model = FirecrawlCrawlNodeOutput
     category = "Firecrawl"  # This will be used by the frontend for subcategory grouping
 
+    def setup(self) -> None:
+        super().setup()
+        # Compile the URL template when the node is created so run() only renders it
+        get_template(self.config.url_template)
+        get_template_variables(self.config.url_template)
+
     async def run(self, input: BaseModel) -> BaseModel:
         """Run the FirecrawlCrawl node."""
         try:
-            # Grab the entire dictionary from the input
-            raw_input_dict = input.model_dump()
-
             # Render url_template
-            url_template = render_template_or_get_first_string(
-                self.config.url_template, raw_input_dict, self.name
-            )
+            url_template = render_url_template(self.config.url_template, input, self.name)
 
-            app = FirecrawlApp()  # type: ignore
+            app = get_firecrawl_app()
 
-            # Start the asynchronous crawl
-            crawl_obj = app.async_crawl_url(  # type: ignore
+            # Start the asynchronous crawl. Not retried, so a failure that came after
+            # Firecrawl accepted the request does not start a second crawl
+            crawl_obj = await call_firecrawl_once(
+                app.async_crawl_url,
                 url_template,
-                params={
-                    "limit": self.config.limit,
-                    "scrapeOptions": {"formats": ["markdown", "html"]},
-                },
+                params={"limit": self.config.limit, "scrapeOptions": CRAWL_SCRAPE_OPTIONS},
             )
 
             # Get the crawl ID from the response
@@ -96,11 +104,15 @@ class FirecrawlCrawlNode(BaseNode):
 
             for attempt in range(max_attempts):
                 # Check the crawl status
-                status_response = app.check_crawl_status(crawl_id)  # type: ignore
+                status_response = await call_firecrawl(app.check_crawl_status, crawl_id)
 
                 if status_response.get("status") == "completed":
                     crawl_result = status_response.get("data", {})
-                    return FirecrawlCrawlNodeOutput(crawl_result=json.dumps(crawl_result))
+                    return FirecrawlCrawlNodeOutput(
+                        crawl_result=orjson.dumps(
+                            crawl_result, option=orjson.OPT_NON_STR_KEYS
+                        ).decode()
+                    )
 
                 if status_response.get("status") == "failed":
                     raise ValueError(
@@ -113,6 +125,6 @@ class FirecrawlCrawlNode(BaseNode):
 
             raise TimeoutError("Crawl did not complete within the maximum allowed time")
 
-        except Exception as e:
-            logging.error(f"Failed to crawl URL: {e}")
+        except Exception:
+            logger.exception("Failed to crawl URL")
             return FirecrawlCrawlNodeOutput(crawl_result="")
@@ -1,13 +1,22 @@
 import json
 import logging
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, Field  # type: ignore
 
-from firecrawl import FirecrawlApp  # type: ignore
-
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 from ...registry import NodeRegistry
-from ...utils.template_utils import render_template_or_get_first_string
+from ...utils.concurrency import gather_with_concurrency
+from ...utils.template_utils import get_template, get_template_variables
+from ._common import (
+    SCRAPE_PARAMS,
+    SCRAPE_WITH_HTML_PARAMS,
+    call_firecrawl,
+    get_firecrawl_app,
+    render_url_template,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class FirecrawlScrapeNodeInput(BaseNodeInput):
@@ -23,6 +32,10 @@ class FirecrawlScrapeNodeOutput(BaseNodeOutput):
     """Output for the FirecrawlScrape node."""
 
     markdown: str = Field(..., description="The scraped data in markdown format.")
+    html: str = Field("", description="The scraped page HTML, if include_html is set.")
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Page metadata such as the title and status code."
+    )
 
 
 class FirecrawlScrapeNodeConfig(BaseNodeConfig):
@@ -32,6 +45,10 @@ class FirecrawlScrapeNodeConfig(BaseNodeConfig):
         "",
         description="The URL to scrape and convert into clean markdown or structured data.",
     )
+    include_html: bool = Field(
+        False,
+        description="Also return the page HTML. This roughly doubles the size of the response.",
+    )
     has_fixed_output: bool = True
     output_json_schema: str = Field(
         default=json.dumps(FirecrawlScrapeNodeOutput.model_json_schema()),
@@ -55,25 +72,38 @@ class FirecrawlScrapeNode(BaseNode):
     output_model = FirecrawlScrapeNodeOutput
     category = "Firecrawl"  # This will be used by the frontend for subcategory grouping
 
+    def setup(self) -> None:
+        super().setup()
+        # Compile the URL template when the node is created so run() only renders it
+        get_template(self.config.url_template)
+        get_template_variables(self.config.url_template)
+
     async def run(self, input: BaseModel) -> BaseModel:
         """Scrapes a URL and returns the content in markdown or structured format."""
         try:
-            # Grab the entire dictionary from the input
-            raw_input_dict = input.model_dump()
-
             # Render url_template
-            url_template = render_template_or_get_first_string(
-                self.config.url_template, raw_input_dict, self.name
+            url_template = render_url_template(self.config.url_template, input, self.name)
+
+            app = get_firecrawl_app()
+            params = SCRAPE_WITH_HTML_PARAMS if self.config.include_html else SCRAPE_PARAMS
+            scrape_result = await call_firecrawl(app.scrape_url, url_template, params=params)
+            return FirecrawlScrapeNodeOutput(
+                markdown=scrape_result["markdown"],
+                html=scrape_result.get("html", ""),
+                metadata=scrape_result.get("metadata", {}),
             )
-
-            app = FirecrawlApp()  # type: ignore
-            scrape_result = app.scrape_url(  # type: ignore
-                url_template,
-                params={
-                    "formats": ["markdown"],
-                },
-            )
-            return FirecrawlScrapeNodeOutput(markdown=scrape_result["markdown"])
-        except Exception as e:
-            logging.error(f"Failed to scrape URL: {e}")
+        except Exception:
+            logger.exception("Failed to scrape URL")
             return FirecrawlScrapeNodeOutput(markdown="")
+
+    async def batch_run(
+        self, urls: List[str], max_concurrency: int = 5
+    ) -> List[FirecrawlScrapeNodeOutput]:
+        """Run the node for each URL, with at most max_concurrency requests in flight.
+
+        Each URL is passed to the url_template as the `url` input.
+        """
+        inputs = [self.input_model.model_validate({"url": url}) for url in urls]
+        return await gather_with_concurrency(
+            (self.run(node_input) for node_input in inputs), max_concurrency
+        )  # type: ignore
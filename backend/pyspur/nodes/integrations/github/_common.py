@@ -0,0 +1,158 @@
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from phi.tools.github import GithubTools
+
+from ...utils.http_client import get_http_client
+from ...utils.retry import retry_transient_errors
+
+# Read results are cached briefly so a workflow that looks up the same repository or pull
+# request more than once only pays for the first request.
+_READ_CACHE_TTL_SECONDS = 60.0
+_READ_CACHE_MAX_SIZE = 1024
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# Pull requests fetched per GraphQL query, well below GitHub's node limit per query
+_GRAPHQL_BATCH_SIZE = 50
+
+_PULL_REQUEST_FIELDS = """
+    number
+    title
+    author { login }
+    body
+    createdAt
+    updatedAt
+    state
+    merged
+    mergeable
+    url
+"""
+
+_github_tools: Optional[GithubTools] = None
+_read_cache: Dict[Tuple[Any, ...], Tuple[float, str]] = {}
+# When the GraphQL rate limit ran out, the time (epoch seconds) at which it resets
+_graphql_rate_limit_reset_at = 0.0
+
+
+def get_github_tools() -> GithubTools:
+    """Return the GithubTools shared by the GitHub nodes.
+
+    Sharing the client keeps PyGithub's HTTP session, and with it the open connections and
+    its request throttling, across node runs. The client is rebuilt only when the access
+    token in the environment changes, e.g. after it is updated through the key management
+    API.
+    """
+    global _github_tools
+    access_token = os.getenv("GITHUB_ACCESS_TOKEN")
+    if _github_tools is None or _github_tools.access_token != access_token:
+        _github_tools = GithubTools(access_token=access_token)
+    return _github_tools
+
+
+async def cached_github_read(method: Callable[..., str], **kwargs: Any) -> str:
+    """Call a read-only GithubTools method, reusing results from the last minute.
+
+    The call runs in a worker thread since PyGithub is synchronous. Error results are not
+    cached. The cache is keyed on the access token too, as results depend on the account.
+    """
+    gh: GithubTools = method.__self__  # type: ignore
+    key = (gh.access_token, method.__name__, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    cached = _read_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    result = await asyncio.to_thread(method, **kwargs)
+    if not result.startswith('{"error"'):
+        if len(_read_cache) >= _READ_CACHE_MAX_SIZE:
+            # Drop expired entries, then the oldest ones if the cache is still full
+            for stale_key in [k for k, (expires_at, _) in _read_cache.items() if expires_at <= now]:
+                del _read_cache[stale_key]
+            while len(_read_cache) >= _READ_CACHE_MAX_SIZE:
+                del _read_cache[next(iter(_read_cache))]
+        _read_cache[key] = (now + _READ_CACHE_TTL_SECONDS, result)
+    return result
+
+
+def _pull_request_info(pr: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a GraphQL pull request like GithubTools.get_pull_request does."""
+    return {
+        "number": pr["number"],
+        "title": pr["title"],
+        "user": (pr["author"] or {}).get("login"),
+        "body": pr["body"],
+        "created_at": pr["createdAt"].replace("Z", "+00:00"),
+        "updated_at": pr["updatedAt"].replace("Z", "+00:00"),
+        "state": "open" if pr["state"] == "OPEN" else "closed",
+        "merged": pr["merged"],
+        "mergeable": {"MERGEABLE": True, "CONFLICTING": False}.get(pr["mergeable"]),
+        "url": pr["url"],
+    }
+
+
+@retry_transient_errors
+async def _post_graphql(query: str, variables: Dict[str, Any], access_token: str) -> Dict[str, Any]:
+    global _graphql_rate_limit_reset_at
+    response = await get_http_client().post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        _graphql_rate_limit_reset_at = float(response.headers.get("X-RateLimit-Reset", 0))
+    response.raise_for_status()
+    return response.json()
+
+
+async def batch_get_pull_requests(refs: List[Tuple[str, int]]) -> List[Dict[str, Any]]:
+    """Fetch several pull requests with one GraphQL query per 50 pull requests.
+
+    `refs` are (repo_name, pr_number) pairs. The results are aligned with `refs` and have
+    the same fields as GithubTools.get_pull_request; a pull request that could not be
+    fetched gets an {"error": ...} entry instead. No further queries are sent once the
+    X-RateLimit-Remaining header reports the rate limit as used up, until it resets; the
+    pull requests left unfetched get error entries, and those already fetched are kept.
+    """
+    access_token = os.getenv("GITHUB_ACCESS_TOKEN")
+    if not access_token:
+        raise ValueError("GITHUB_ACCESS_TOKEN is required for the GitHub GraphQL API")
+
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(refs), _GRAPHQL_BATCH_SIZE):
+        if _graphql_rate_limit_reset_at > time.time():
+            error = (
+                "GitHub GraphQL rate limit exceeded until "
+                f"{time.strftime('%H:%M:%S', time.localtime(_graphql_rate_limit_reset_at))}"
+            )
+            results.extend({"error": error} for _ in refs[start:])
+            break
+        batch = refs[start : start + _GRAPHQL_BATCH_SIZE]
+        # Aliases (p0, p1, ...) let one query hold several repository lookups
+        parameters: List[str] = []
+        selections: List[str] = []
+        variables: Dict[str, Any] = {}
+        for i, (repo_name, pr_number) in enumerate(batch):
+            owner, _, name = repo_name.partition("/")
+            parameters.append(f"$owner{i}: String!, $name{i}: String!, $number{i}: Int!")
+            selections.append(
+                f"p{i}: repository(owner: $owner{i}, name: $name{i}) "
+                f"{{ pullRequest(number: $number{i}) {{ {_PULL_REQUEST_FIELDS} }} }}"
+            )
+            variables.update({f"owner{i}": owner, f"name{i}": name, f"number{i}": pr_number})
+        query = f"query({', '.join(parameters)}) {{ {' '.join(selections)} }}"
+
+        response = await _post_graphql(query, variables, access_token)
+        data = response.get("data") or {}
+        errors: Dict[str, str] = {}
+        for error in response.get("errors") or []:
+            alias = (error.get("path") or ["p?"])[0]
+            errors.setdefault(alias, error.get("message", "Unknown error"))
+        for i in range(len(batch)):
+            pull_request = (data.get(f"p{i}") or {}).get("pullRequest")
+            if pull_request is None:
+                results.append({"error": errors.get(f"p{i}", "Pull request not found")})
+            else:
+                results.append(_pull_request_info(pull_request))
+    return results
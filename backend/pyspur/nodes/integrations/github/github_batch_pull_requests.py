@@ -0,0 +1,84 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field  # type: ignore
+
+from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import batch_get_pull_requests
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubBatchPullRequestsNodeInput(BaseNodeInput):
+    """Input for the GitHubBatchPullRequests node."""
+
+    class Config:
+        extra = "allow"
+
+
+class GitHubBatchPullRequestsNodeOutput(BaseNodeOutput):
+    pull_requests: str = Field(
+        ...,
+        description="Details of the requested pull requests in JSON format, in the order they "
+        "were requested.",
+    )
+
+
+class GitHubBatchPullRequestsNodeConfig(BaseNodeConfig):
+    pull_requests: str = Field(
+        "",
+        description="The pull requests to fetch, as 'owner/repo#number' separated by commas "
+        "or new lines.",
+    )
+    has_fixed_output: bool = True
+    output_json_schema: str = Field(
+        default=json.dumps(GitHubBatchPullRequestsNodeOutput.model_json_schema()),
+        description="The JSON schema for the output of the node",
+    )
+
+
+def _parse_pull_request_ref(ref: str) -> Optional[Tuple[str, int]]:
+    """Parse an 'owner/repo#number' reference, or return None if it is malformed."""
+    repo_name, _, pr_number = ref.rpartition("#")
+    repo_name = repo_name.strip()
+    pr_number = pr_number.strip()
+    if "/" not in repo_name or not pr_number.isdigit():
+        return None
+    return repo_name, int(pr_number)
+
+
+class GitHubBatchPullRequestsNode(BaseNode):
+    name = "github_batch_pull_requests_node"
+    display_name = "GitHubBatchPullRequests"
+    logo = "/images/github.png"
+    category = "GitHub"
+
+    config_model = GitHubBatchPullRequestsNodeConfig
+    input_model = GitHubBatchPullRequestsNodeInput
+    output_model = GitHubBatchPullRequestsNodeOutput
+
+    async def run(self, input: BaseModel) -> BaseModel:
+        try:
+            refs = [
+                ref.strip()
+                for ref in self.config.pull_requests.replace(",", "\n").splitlines()
+                if ref.strip()
+            ]
+            parsed_refs = [_parse_pull_request_ref(ref) for ref in refs]
+            valid_refs = [parsed for parsed in parsed_refs if parsed is not None]
+            fetched = iter(await batch_get_pull_requests(valid_refs) if valid_refs else [])
+            # Malformed references get their own error entry, in their place in the output
+            pull_requests: List[Dict[str, Any]] = []
+            for ref, parsed in zip(refs, parsed_refs, strict=True):
+                if parsed is None:
+                    error = f"Invalid pull request reference {ref!r}, expected owner/repo#number"
+                    pull_requests.append({"error": error})
+                else:
+                    pull_requests.append(next(fetched))
+            return GitHubBatchPullRequestsNodeOutput(
+                pull_requests=json.dumps(pull_requests, indent=2)
+            )
+        except Exception:
+            logger.exception("Failed to get pull requests")
+            return GitHubBatchPullRequestsNodeOutput(pull_requests="")
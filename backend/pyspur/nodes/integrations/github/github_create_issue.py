@@ -1,11 +1,14 @@
+import asyncio
 import json
 import logging
 from typing import Optional
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubCreateIssueNodeInput(BaseNodeInput):
@@ -42,13 +45,14 @@ class GitHubCreateIssueNode(BaseNode):
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
-            gh = GithubTools()
-            issue_info = gh.create_issue(
+            gh = get_github_tools()
+            issue_info = await asyncio.to_thread(
+                gh.create_issue,
                 repo_name=self.config.repo_name,
                 title=self.config.issue_title,
                 body=self.config.body,
             )
             return GitHubCreateIssueNodeOutput(issue=issue_info)
-        except Exception as e:
-            logging.error(f"Failed to create issue: {e}")
+        except Exception:
+            logger.exception("Failed to create issue")
             return GitHubCreateIssueNodeOutput(issue="")
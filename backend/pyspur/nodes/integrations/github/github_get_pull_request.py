@@ -1,10 +1,12 @@
 import json
 import logging
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import cached_github_read, get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubGetPullRequestNodeInput(BaseNodeInput):
@@ -42,12 +44,13 @@ class GitHubGetPullRequestNode(BaseNode):
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
-            gh = GithubTools()
-            pr_details = gh.get_pull_request(
+            gh = get_github_tools()
+            pr_details = await cached_github_read(
+                gh.get_pull_request,
                 repo_name=self.config.repo_name,
                 pr_number=int(self.config.pr_number),
             )
             return GitHubGetPullRequestNodeOutput(pull_request=pr_details)
-        except Exception as e:
-            logging.error(f"Failed to get pull request details: {e}")
+        except Exception:
+            logger.exception("Failed to get pull request details")
             return GitHubGetPullRequestNodeOutput(pull_request="")
@@ -2,10 +2,12 @@ import json
 import logging
 from typing import Optional
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import cached_github_read, get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubGetPullRequestChangesNodeInput(BaseNodeInput):
@@ -44,11 +46,13 @@ class GitHubGetPullRequestChangesNode(BaseNode):
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
-            gh = GithubTools()
-            pr_changes = gh.get_pull_request_changes(
-                repo_name=self.config.repo_name, pr_number=self.config.pr_number
+            gh = get_github_tools()
+            pr_changes = await cached_github_read(
+                gh.get_pull_request_changes,
+                repo_name=self.config.repo_name,
+                pr_number=self.config.pr_number,
             )
             return GitHubGetPullRequestChangesNodeOutput(pull_request_changes=pr_changes)
-        except Exception as e:
-            logging.error(f"Failed to get pull request changes: {e}")
+        except Exception:
+            logger.exception("Failed to get pull request changes")
             return GitHubGetPullRequestChangesNodeOutput(pull_request_changes="")
@@ -1,10 +1,12 @@
 import json
 import logging
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import cached_github_read, get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubGetRepositoryNodeInput(BaseNodeInput):
@@ -41,9 +43,11 @@ class GitHubGetRepositoryNode(BaseNode):
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
-            gh = GithubTools()
-            repo_details = gh.get_repository(repo_name=self.config.repo_name)
+            gh = get_github_tools()
+            repo_details = await cached_github_read(
+                gh.get_repository, repo_name=self.config.repo_name
+            )
             return GitHubGetRepositoryNodeOutput(repository_details=repo_details)
-        except Exception as e:
-            logging.error(f"Failed to get repository details: {e}")
+        except Exception:
+            logger.exception("Failed to get repository details")
             return GitHubGetRepositoryNodeOutput(repository_details="")
@@ -1,10 +1,13 @@
+import asyncio
 import json
 import logging
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import cached_github_read, get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubListPullRequestsNodeInput(BaseNodeInput):
@@ -49,18 +52,17 @@ class GitHubListPullRequestsNode(BaseNode):
         Fetches the pull requests for a given GitHub repository URL and state.
         """
         try:
-            gh = GithubTools()
-            pull_requests = gh.list_pull_requests(
-                repo_name=self.config.repo_name, state=self.config.state
+            gh = get_github_tools()
+            pull_requests = await cached_github_read(
+                gh.list_pull_requests, repo_name=self.config.repo_name, state=self.config.state
             )
             return GitHubListPullRequestsNodeOutput(pull_requests=pull_requests)
-        except Exception as e:
-            logging.error(f"Failed to get pull requests: {e}")
+        except Exception:
+            logger.exception("Failed to get pull requests")
             return GitHubListPullRequestsNodeOutput(pull_requests="")
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def main():
         # Example usage
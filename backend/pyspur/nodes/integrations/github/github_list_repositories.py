@@ -1,10 +1,12 @@
 import json
 import logging
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import cached_github_read, get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubListRepositoriesNodeInput(BaseNodeInput):
@@ -38,9 +40,9 @@ class GitHubListRepositoriesNode(BaseNode):
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
-            gh = GithubTools()
-            repositories = gh.list_repositories()
+            gh = get_github_tools()
+            repositories = await cached_github_read(gh.list_repositories)
             return GitHubListRepositoriesNodeOutput(repositories=repositories)
-        except Exception as e:
-            logging.error(f"Failed to list repositories: {e}")
+        except Exception:
+            logger.exception("Failed to list repositories")
             return GitHubListRepositoriesNodeOutput(repositories="")
@@ -1,10 +1,12 @@
 import json
 import logging
 
-from phi.tools.github import GithubTools
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ._common import cached_github_read, get_github_tools
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubSearchRepositoriesNodeInput(BaseNodeInput):
@@ -48,14 +50,15 @@ class GitHubSearchRepositoriesNode(BaseNode):
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
-            gh = GithubTools()
-            repos = gh.search_repositories(
+            gh = get_github_tools()
+            repos = await cached_github_read(
+                gh.search_repositories,
                 query=self.config.query,
                 sort=self.config.sort,
                 order=self.config.order,
                 per_page=self.config.per_page,
             )
             return GitHubSearchRepositoriesNodeOutput(repositories=repos)
-        except Exception as e:
-            logging.error(f"Failed to search repositories: {e}")
+        except Exception:
+            logger.exception("Failed to search repositories")
             return GitHubSearchRepositoriesNodeOutput(repositories="")
@@ -1,11 +1,17 @@
 import json
 import logging
+from typing import Dict, List
 
 import httpx
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
-from ...utils.template_utils import render_template_or_get_first_string
+from ...utils.concurrency import gather_with_concurrency
+from ...utils.http_client import get_http_client
+from ...utils.retry import retry_transient_errors
+from ...utils.template_utils import get_template_context, render_template_or_get_first_string
+
+logger = logging.getLogger(__name__)
 
 
 class JinaReaderNodeInput(BaseNodeInput):
@@ -33,6 +39,13 @@ class JinaReaderNodeConfig(BaseNodeConfig):
     )
 
 
+@retry_transient_errors
+async def _fetch(url: str, headers: Dict[str, str]) -> httpx.Response:
+    response = await get_http_client().get(url, headers=headers, timeout=None)
+    response.raise_for_status()
+    return response
+
+
 class JinaReaderNode(BaseNode):
     name = "jina_reader_node"
     display_name = "Reader"
@@ -51,22 +64,33 @@ class JinaReaderNode(BaseNode):
             if self.config.use_readerlm_v2:
                 headers["X-Respond-With"] = "readerlm-v2"
 
-            # Grab the entire dictionary from the input
-            raw_input_dict = input.model_dump()
+            # Template context dumped from only the input fields the template reads
+            raw_input_dict = get_template_context(input, self.config.url_template)
 
             # Render url_template
             reader_url = render_template_or_get_first_string(
                 self.config.url_template, raw_input_dict, self.name
             )
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(reader_url, headers=headers, timeout=None)
-                logging.debug("Fetched from Jina: {text}".format(text=response.text))
-                output = JinaReaderNodeOutput.model_validate(response.json()["data"])
-                if output.content.startswith("```markdown"):
-                    # remove the backticks/code format indicators in the output
-                    output.content = output.content[12:-4]
-                return output
-        except Exception as e:
-            logging.error(f"Failed to convert URL: {e}")
+            response = await _fetch(reader_url, headers)
+            logger.debug("Fetched from Jina: %s", response.text)
+            output = JinaReaderNodeOutput.model_validate(response.json()["data"])
+            if output.content.startswith("```markdown"):
+                # remove the backticks/code format indicators in the output
+                output.content = output.content[12:-4]
+            return output
+        except Exception:
+            logger.exception("Failed to convert URL")
             return JinaReaderNodeOutput(title="", content="")
+
+    async def batch_run(
+        self, urls: List[str], max_concurrency: int = 5
+    ) -> List[JinaReaderNodeOutput]:
+        """Run the node for each URL, with at most max_concurrency requests in flight.
+
+        Each URL is passed to the url_template as the `url` input.
+        """
+        inputs = [self.input_model.model_validate({"url": url}) for url in urls]
+        return await gather_with_concurrency(
+            (self.run(node_input) for node_input in inputs), max_concurrency
+        )  # type: ignore
@@ -2,11 +2,13 @@ import json
 import logging
 import os
 
-import requests
 from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
-from ...utils.template_utils import render_template_or_get_first_string
+from ...utils.http_client import get_http_client
+from ...utils.template_utils import get_template_context, render_template_or_get_first_string
+
+logger = logging.getLogger(__name__)
 
 
 class MathpixPdfToLatexNodeInput(BaseNodeInput):
@@ -55,8 +57,8 @@ class MathpixPdfToLatexNode(BaseNode):
         Converts a PDF to LaTeX using the Mathpix API.
         """
         try:
-            # Get input dictionary
-            raw_input_dict = input.model_dump()
+            # Template context dumped from only the input fields the template reads
+            raw_input_dict = get_template_context(input, self.config.url_template)
 
             # Render URL template
             url = render_template_or_get_first_string(
@@ -71,7 +73,7 @@ class MathpixPdfToLatexNode(BaseNode):
                 raise ValueError("Mathpix API credentials not provided")
 
             # Make API request
-            response = requests.post(
+            response = await get_http_client().post(
                 "https://api.mathpix.com/v3/pdf",
                 json={"url": url, "conversion_formats": {"tex.zip": True}},
                 headers={
@@ -79,11 +81,12 @@ class MathpixPdfToLatexNode(BaseNode):
                     "app_key": app_key,
                     "Content-type": "application/json",
                 },
+                timeout=None,
             )
 
             # Return the conversion result
             return MathpixPdfToLatexNodeOutput(latex_result=json.dumps(response.json(), indent=2))
 
         except Exception as e:
-            logging.error(f"Failed to convert PDF to LaTeX: {e}")
+            logger.exception("Failed to convert PDF to LaTeX")
             return MathpixPdfToLatexNodeOutput(latex_result=str(e))
@@ -2,10 +2,13 @@ import json
 import logging
 from typing import List, Optional
 
-import requests
+import orjson
 from pydantic import BaseModel, Field
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ...utils.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
 
 
 class FacebookAdLibraryNodeInput(BaseNodeInput):
@@ -102,19 +105,19 @@ class FacebookAdLibraryNode(BaseNode):
                 "publisher_platforms": ",".join(self.config.platforms),
             }
 
-            response = requests.get(base_url, params=params)
+            response = await get_http_client().get(base_url, params=params)
             if response.status_code != 200:
                 raise Exception(f"API request failed: {response.text}")
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Format and return the results
             ads_data = data.get("data", [])
             if len(ads_data) > self.config.max_ads:
                 ads_data = ads_data[: self.config.max_ads]
 
-            return FacebookAdLibraryNodeOutput(ads=json.dumps(ads_data))
+            return FacebookAdLibraryNodeOutput(ads=orjson.dumps(ads_data).decode())
 
-        except Exception as e:
-            logging.error(f"Failed to retrieve Facebook ads: {str(e)}")
+        except Exception:
+            logger.exception("Failed to retrieve Facebook ads")
             return FacebookAdLibraryNodeOutput(ads="[]")
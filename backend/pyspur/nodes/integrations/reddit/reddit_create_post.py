@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 
+logger = logging.getLogger(__name__)
+
 
 class RedditCreatePostNodeInput(BaseNodeInput):
     """Input for the RedditCreatePost node."""
@@ -92,8 +94,8 @@ class RedditCreatePostNode(BaseNode):
             # Verify authentication
             try:
                 reddit.user.me()
-            except Exception as e:
-                logging.error(f"Authentication error: {e}")
+            except Exception:
+                logger.exception("Authentication error")
                 return RedditCreatePostNodeOutput(
                     post_info=RedditCreatePostError(error="Failed to authenticate with Reddit")
                 )
@@ -136,7 +138,7 @@ class RedditCreatePostNode(BaseNode):
 
             return RedditCreatePostNodeOutput(post_info=post_info)
         except Exception as e:
-            logging.error(f"Failed to create post: {e}")
+            logger.exception("Failed to create post")
             return RedditCreatePostNodeOutput(
                 post_info=RedditCreatePostError(error=f"Failed to create post: {str(e)}")
             )
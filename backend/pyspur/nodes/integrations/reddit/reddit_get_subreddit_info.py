@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 
+logger = logging.getLogger(__name__)
+
 
 class RedditGetSubredditInfoNodeInput(BaseNodeInput):
     """Input for the RedditGetSubredditInfo node"""
@@ -73,7 +75,7 @@ class RedditGetSubredditInfoNode(BaseNode):
         except ValueError as e:
             if "Unsupported JSON schema type" in str(e):
                 # If we hit schema issues, use a very basic setup
-                logging.warning(f"Schema error: {e}, using simplified approach")
+                logger.warning("Schema error: %s, using simplified approach", e)
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
@@ -105,5 +107,5 @@ class RedditGetSubredditInfoNode(BaseNode):
             )
             return RedditGetSubredditInfoNodeOutput(subreddit_info=info)
         except Exception as e:
-            logging.error(f"Failed to get subreddit info: {e}")
+            logger.exception("Failed to get subreddit info")
             raise e
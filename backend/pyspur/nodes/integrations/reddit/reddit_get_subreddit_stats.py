@@ -7,6 +7,8 @@ from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 
+logger = logging.getLogger(__name__)
+
 
 class RedditGetSubredditStatsNodeInput(BaseNodeInput):
     """Input for the RedditGetSubredditStats node"""
@@ -80,7 +82,7 @@ class RedditGetSubredditStatsNode(BaseNode):
         except ValueError as e:
             if "Unsupported JSON schema type" in str(e):
                 # If we hit schema issues, use a very basic setup
-                logging.warning(f"Schema error: {e}, using simplified approach")
+                logger.warning("Schema error: %s, using simplified approach", e)
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
@@ -124,5 +126,5 @@ class RedditGetSubredditStatsNode(BaseNode):
 
             return RedditGetSubredditStatsNodeOutput(subreddit_stats=stats)
         except Exception as e:
-            logging.error(f"Failed to get subreddit stats: {e}")
+            logger.exception("Failed to get subreddit stats")
             raise e
@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 
+logger = logging.getLogger(__name__)
+
 
 class RedditGetTopPostsNodeInput(BaseNodeInput):
     """Input for the RedditGetTopPosts node."""
@@ -81,7 +83,7 @@ class RedditGetTopPostsNode(BaseNode):
         except ValueError as e:
             if "Unsupported JSON schema type" in str(e):
                 # If we hit schema issues, use a very basic setup
-                logging.warning(f"Schema error: {e}, using simplified approach")
+                logger.warning("Schema error: %s, using simplified approach", e)
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
@@ -121,5 +123,5 @@ class RedditGetTopPostsNode(BaseNode):
 
             return RedditGetTopPostsNodeOutput(top_posts=top_posts)
         except Exception as e:
-            logging.error(f"Failed to get top posts: {e}")
+            logger.exception("Failed to get top posts")
             raise e
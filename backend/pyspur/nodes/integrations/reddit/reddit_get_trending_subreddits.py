@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 
+logger = logging.getLogger(__name__)
+
 
 class RedditGetTrendingSubredditsNodeInput(BaseNodeInput):
     """Input for the RedditGetTrendingSubreddits node"""
@@ -73,7 +75,7 @@ class RedditGetTrendingSubredditsNode(BaseNode):
         except ValueError as e:
             if "Unsupported JSON schema type" in str(e):
                 # If we hit schema issues, use a very basic setup
-                logging.warning(f"Schema error: {e}, using simplified approach")
+                logger.warning("Schema error: %s, using simplified approach", e)
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
@@ -105,5 +107,5 @@ class RedditGetTrendingSubredditsNode(BaseNode):
 
             return RedditGetTrendingSubredditsNodeOutput(trending_subreddits=trending)
         except Exception as e:
-            logging.error(f"Failed to get trending subreddits: {e}")
+            logger.exception("Failed to get trending subreddits")
             raise e
@@ -7,6 +7,8 @@ from pydantic import BaseModel, Field  # type: ignore
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 
+logger = logging.getLogger(__name__)
+
 
 class RedditGetUserInfoNodeInput(BaseNodeInput):
     """Input for the RedditGetUserInfo node"""
@@ -70,7 +72,7 @@ class RedditGetUserInfoNode(BaseNode):
         except ValueError as e:
             if "Unsupported JSON schema type" in str(e):
                 # If we hit schema issues, use a very basic setup
-                logging.warning(f"Schema error: {e}, using simplified approach")
+                logger.warning("Schema error: %s, using simplified approach", e)
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
@@ -99,5 +101,5 @@ class RedditGetUserInfoNode(BaseNode):
             )
             return RedditGetUserInfoNodeOutput(user_info=info)
         except Exception as e:
-            logging.error(f"Failed to get user info: {e}")
+            logger.exception("Failed to get user info")
             raise e
@@ -1,11 +1,14 @@
+import asyncio
 import json
 from enum import Enum
-from jinja2 import Template
+from typing import Dict, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, Field
 
 from ....integrations.slack.client import SlackClient
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ...utils.template_utils import get_template
 
 
 class ModeEnum(str, Enum):
@@ -44,6 +47,133 @@ class SlackNotifyNodeConfig(BaseNodeConfig):
     )
 
 
+_slack_client: Optional[SlackClient] = None
+
+
+def _get_slack_client() -> SlackClient:
+    """Return the SlackClient shared by all SlackNotify nodes, creating it on first use."""
+    global _slack_client
+    if _slack_client is None:
+        _slack_client = SlackClient()
+    return _slack_client
+
+
+# Slack rejects messages longer than this, so batches are split to stay under it
+_MAX_MESSAGE_LENGTH = 40000
+_BATCH_SEPARATOR = "\n---\n"
+
+_PendingMessage = Tuple[str, "asyncio.Future[Tuple[bool, str]]"]
+
+
+class _SlackMessageBatcher:
+    """Coalesce messages sent to the same channel in quick succession into one post.
+
+    The first message for a (channel, mode) pair opens a batch. The batch is sent once
+    `batch_interval` seconds have passed or `max_batch_size` messages have joined it,
+    whichever comes first. Every sender gets the status of the post its message was in.
+
+    To stay within Slack's rate limits, at most `max_concurrent_posts` posts are in flight
+    at once, and posts to the same channel are sent one at a time, at least
+    `min_post_interval` seconds apart.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 10,
+        batch_interval: float = 0.05,
+        max_concurrent_posts: int = 4,
+        min_post_interval: float = 1.0,
+    ) -> None:
+        self._max_batch_size = max_batch_size
+        self._batch_interval = batch_interval
+        self._min_post_interval = min_post_interval
+        self._pending: Dict[Tuple[str, str], List[_PendingMessage]] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._post_semaphore = asyncio.Semaphore(max_concurrent_posts)
+        self._channel_locks: Dict[str, asyncio.Lock] = {}
+        self._last_post_at: Dict[str, float] = {}
+
+    async def submit(self, channel: str, mode: str, text: str) -> Tuple[bool, str]:
+        loop = asyncio.get_running_loop()
+        key = (channel, mode)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self._batch_interval, self._flush, key, batch)
+        future: "asyncio.Future[Tuple[bool, str]]" = loop.create_future()
+        batch.append((text, future))
+        if len(batch) >= self._max_batch_size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Tuple[str, str], batch: List[_PendingMessage]) -> None:
+        # The timer of a batch that was already flushed because it was full does nothing
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        task = asyncio.ensure_future(self._send(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key: Tuple[str, str], batch: List[_PendingMessage]) -> None:
+        channel, mode = key
+        posts: List[List[_PendingMessage]] = []
+        length = 0
+        for message in batch:
+            added_length = len(_BATCH_SEPARATOR) + len(message[0])
+            if posts and length + added_length <= _MAX_MESSAGE_LENGTH:
+                posts[-1].append(message)
+                length += added_length
+            else:
+                posts.append([message])
+                length = len(message[0])
+
+        for post in posts:
+            try:
+                result = await self._post(
+                    channel, mode, _BATCH_SEPARATOR.join(text for text, _ in post)
+                )
+            except Exception as e:
+                for _, future in post:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in post:
+                    if not future.done():
+                        future.set_result(result)
+
+    async def _post(self, channel: str, mode: str, text: str) -> Tuple[bool, str]:
+        loop = asyncio.get_running_loop()
+        async with self._channel_locks.setdefault(channel, asyncio.Lock()):
+            last_post_at = self._last_post_at.get(channel)
+            if last_post_at is not None:
+                delay = last_post_at + self._min_post_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with self._post_semaphore:
+                try:
+                    # The Slack SDK client is synchronous, so send from a worker thread
+                    return await asyncio.to_thread(
+                        _get_slack_client().send_message, channel=channel, text=text, mode=mode
+                    )
+                finally:
+                    self._last_post_at[channel] = loop.time()
+
+
+# Batches hold futures of the loop that created them, so keep one batcher per loop
+_batchers: "WeakKeyDictionary[asyncio.AbstractEventLoop, _SlackMessageBatcher]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_message_batcher() -> _SlackMessageBatcher:
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _batchers[loop] = _SlackMessageBatcher()
+    return batcher
+
+
 class SlackNotifyNode(BaseNode):
     name = "slack_notify_node"
     display_name = "SlackNotify"
@@ -61,18 +191,18 @@ class SlackNotifyNode(BaseNode):
         # convert data to a string and send it to the Slack channel
         if not self.config.message.strip():
             # If no template is provided, dump the entire input as JSON
-            message = json.dumps(input.model_dump(), indent=2)
+            message = input.model_dump_json(indent=2)
         else:
             # Render the message template with input variables
             try:
-                message = Template(self.config.message).render(**input.model_dump())
+                message = get_template(self.config.message).render(**input.model_dump())
             except Exception as e:
                 print(f"[ERROR] Failed to render message template in {self.name}")
                 print(f"[ERROR] Template: {self.config.message} with input: {input.model_dump()}")
                 raise e
 
-        client = SlackClient()
-        ok, status = client.send_message(
-            channel=self.config.channel, text=message, mode=self.config.mode
-        )  # type: ignore
+        # Messages sent to the same channel at about the same time go out as one post
+        ok, status = await _get_message_batcher().submit(
+            self.config.channel, self.config.mode.value, message
+        )
         return SlackNotifyNodeOutput(status=status)
@@ -1,11 +1,47 @@
+import asyncio
+import html
 import json
 import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
 
+from defusedxml import ElementTree
 from phi.tools.youtube_tools import YouTubeTools
 from pydantic import BaseModel, Field
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
-from ...utils.template_utils import render_template_or_get_first_string
+from ...utils.http_client import get_http_client
+from ...utils.template_utils import (
+    get_first_string,
+    get_template_context,
+    render_template_or_get_first_string,
+)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.getenv("PROJECT_ROOT", os.getcwd())
+TRANSCRIPT_CACHE_DIR = Path(PROJECT_ROOT) / "data" / "cache" / "youtube_transcripts"
+_TRANSCRIPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+_VIDEO_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{6,32}")
+
+# The same pages youtube_transcript_api reads, fetched on the pooled async client
+_WATCH_URL = "https://www.youtube.com/watch?v={video_id}"
+_CONSENT_FORM = 'action="https://consent.youtube.com/s"'
+_CONSENT_VALUE_PATTERN = re.compile(r'name="v" value="(.*?)"')
+_CAPTION_TAG_PATTERN = re.compile(r"<[^>]*>")
+_CAPTION_LANGUAGES = ("en",)
+_YOUTUBE_TIMEOUT_SECONDS = 15.0
+
+# Transcript fetches in progress on each event loop, by video ID
+_InflightFetches = Dict[str, "asyncio.Future[str]"]
+_inflight_fetches: "WeakKeyDictionary[asyncio.AbstractEventLoop, _InflightFetches]" = (
+    WeakKeyDictionary()
+)
 
 
 class YouTubeTranscriptNodeInput(BaseNodeInput):
@@ -31,6 +67,135 @@ class YouTubeTranscriptNodeConfig(BaseNodeConfig):
     )
 
 
+def _extract_video_id(url: str) -> Optional[str]:
+    """Return the video ID of a YouTube URL, so that URL variants share a cache entry."""
+    try:
+        video_id = YouTubeTools().get_youtube_video_id(url)
+    except Exception:
+        return None
+    if video_id is None or not _VIDEO_ID_PATTERN.fullmatch(video_id):
+        return None
+    return video_id
+
+
+async def _fetch_watch_page(video_id: str) -> str:
+    """Return the HTML of a video's watch page, accepting the cookie consent form if shown."""
+    headers = {"Accept-Language": "en-US"}
+    for _ in range(2):
+        response = await get_http_client().get(
+            _WATCH_URL.format(video_id=video_id),
+            headers=headers,
+            timeout=_YOUTUBE_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        page = html.unescape(response.text)
+        if _CONSENT_FORM not in page:
+            return page
+        match = _CONSENT_VALUE_PATTERN.search(page)
+        if match is None:
+            break
+        headers["Cookie"] = f"CONSENT=YES+{match.group(1)}"
+    raise ValueError("Failed to accept the YouTube cookie consent")
+
+
+async def _fetch_captions(video_id: str) -> Tuple[bool, str]:
+    """Fetch a video's English captions as one string, without blocking the event loop.
+
+    Mirrors YouTubeTools.get_youtube_video_captions: manually created captions are preferred
+    over generated ones, and failures are returned as messages rather than raised. Returns
+    whether the captions were found, along with the captions or the failure message.
+    """
+    try:
+        page = await _fetch_watch_page(video_id)
+        parts = page.split('"captions":')
+        if len(parts) <= 1:
+            return False, "No captions found for video"
+        captions_json = json.loads(parts[1].split(',"videoDetails')[0].replace("\n", ""))
+        tracks = (captions_json.get("playerCaptionsTracklistRenderer") or {}).get(
+            "captionTracks", []
+        )
+        track = next(
+            (
+                track
+                for generated in (False, True)
+                for language in _CAPTION_LANGUAGES
+                for track in tracks
+                if track.get("languageCode") == language
+                and (track.get("kind", "") == "asr") == generated
+            ),
+            None,
+        )
+        if track is None:
+            return False, "No captions found for video"
+
+        response = await get_http_client().get(
+            track["baseUrl"],
+            headers={"Accept-Language": "en-US"},
+            timeout=_YOUTUBE_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        lines = [
+            _CAPTION_TAG_PATTERN.sub("", html.unescape(element.text))
+            for element in ElementTree.fromstring(response.text)
+            if element.text is not None
+        ]
+        if lines:
+            return True, " ".join(lines)
+        return False, "No captions found for video"
+    except Exception as e:
+        return False, f"Error getting captions for video: {e}"
+
+
+async def _get_transcript(video_id: Optional[str]) -> str:
+    """Fetch a video's transcript, reusing transcripts fetched in the last week.
+
+    Transcripts are cached on disk by video ID. Error messages are not cached.
+    """
+    if video_id is None:
+        return "Error getting video ID from URL, please provide a valid YouTube url"
+
+    cache_path = TRANSCRIPT_CACHE_DIR / f"{video_id}.txt"
+    try:
+        if time.time() - cache_path.stat().st_mtime < _TRANSCRIPT_CACHE_TTL_SECONDS:
+            return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass  # Not cached yet
+
+    found, transcript = await _fetch_captions(video_id)
+    if found:
+        try:
+            TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial transcript
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=TRANSCRIPT_CACHE_DIR, suffix=".tmp", delete=False
+            ) as f:
+                f.write(transcript)
+            os.replace(f.name, cache_path)
+        except OSError:
+            logger.warning("Failed to cache the transcript of video %s", video_id)
+    return transcript
+
+
+async def _fetch_transcript(video_url: str) -> str:
+    """Fetch a video's transcript, sharing fetches already in progress.
+
+    Concurrent runs for the same video, even through different URL forms, wait for the
+    same fetch instead of each requesting the transcript.
+    """
+    video_id = _extract_video_id(video_url)
+    if video_id is None:
+        return await _get_transcript(None)
+
+    inflight = _inflight_fetches.setdefault(asyncio.get_running_loop(), {})
+    fetch = inflight.get(video_id)
+    if fetch is None:
+        fetch = asyncio.ensure_future(_get_transcript(video_id))
+        inflight[video_id] = fetch
+        fetch.add_done_callback(lambda _: inflight.pop(video_id, None))
+    # Shielded so that a cancelled run does not cancel the fetch for the others
+    return await asyncio.shield(fetch)
+
+
 class YouTubeTranscriptNode(BaseNode):
     name = "youtube_transcript_node"
     display_name = "YouTubeTranscript"
@@ -46,17 +211,22 @@ class YouTubeTranscriptNode(BaseNode):
         Fetches the transcript for a given YouTube video ID and languages.
         """
         try:
-            # Grab the entire dictionary from the input
-            raw_input_dict = input.model_dump()
+            if self.config.video_url_template.strip():
+                # Template context built from the input fields the template reads
+                raw_input_dict = get_template_context(input, self.config.video_url_template)
 
-            # Render video_url_template
-            video_url = render_template_or_get_first_string(
-                self.config.video_url_template, raw_input_dict, self.name
-            )
+                # Render video_url_template
+                video_url = render_template_or_get_first_string(
+                    self.config.video_url_template, raw_input_dict, self.name
+                )
+            else:
+                # No template: use the first string input, read straight off the model
+                video_url = get_first_string(input)
+                if video_url is None:
+                    raise ValueError(f"No string type found in the input: {input}")
 
-            yt = YouTubeTools()
-            transcript: str = yt.get_youtube_video_captions(url=video_url)
+            transcript = await _fetch_transcript(video_url)
             return YouTubeTranscriptNodeOutput(transcript=transcript)
-        except Exception as e:
-            logging.error(f"Failed to get transcript: {e}")
+        except Exception:
+            logger.exception("Failed to get transcript")
             return YouTubeTranscriptNodeOutput(transcript="")
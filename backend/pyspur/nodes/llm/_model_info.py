@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Optional, Set
+from functools import lru_cache
+from typing import Dict, Optional, Set
 
 from pydantic import BaseModel
 
@@ -145,6 +146,12 @@ class LLMModels(str, Enum):
 
     @classmethod
     def get_model_info(cls, model_id: str) -> LLMModel | None:
+        return cls._model_registry().get(model_id)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _model_registry(cls) -> Dict[str, LLMModel]:
+        """Build the registry of model info once; it is fixed for the life of the process."""
         model_registry = {
             cls.O3_MINI.value: LLMModel(
                 id=cls.O3_MINI.value,
@@ -584,4 +591,4 @@ class LLMModels(str, Enum):
                     ),
             ),
         }
-        return model_registry.get(model_id)
+        return model_registry
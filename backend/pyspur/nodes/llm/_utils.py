@@ -1,32 +1,39 @@
 # type: ignore
+import asyncio
 import base64
 import json
 import logging
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
 
-import litellm
+import httpx
+import orjson
 from docx2python import docx2python
 from dotenv import load_dotenv
-from litellm import acompletion
-from litellm.types.utils import Message
-from ollama import AsyncClient
 from pydantic import BaseModel, Field
-from tenacity import AsyncRetrying, stop_after_attempt, wait_random_exponential
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from ...utils.file_utils import encode_file_to_base64_data_url
 from ...utils.mime_types_utils import get_mime_type_for_url
 from ...utils.path_utils import is_external_url, resolve_file_path
+from ..utils.rate_limiter import get_rate_limiter
 from ._model_info import LLMModels
 from ._providers import OllamaOptions, setup_azure_configuration
 
-# uncomment for debugging litellm issues
-# litellm.set_verbose=True
-load_dotenv()
+if TYPE_CHECKING:
+    from litellm.types.utils import Message
+    from ollama import AsyncClient
 
-# Enable parameter dropping for unsupported parameters
-litellm.drop_params = True
+load_dotenv()
 
 # Clean up Azure API base URL if needed
 azure_api_base = os.getenv("AZURE_OPENAI_API_BASE", "").rstrip("/")
@@ -34,14 +41,31 @@ if azure_api_base.endswith("/openai"):
     azure_api_base = azure_api_base.rstrip("/openai")
 os.environ["AZURE_OPENAI_API_BASE"] = azure_api_base
 
-# Set OpenAI base URL if provided
-openai_base_url = os.getenv("OPENAI_API_BASE")
-if openai_base_url:
-    litellm.api_base = openai_base_url
 
-# If Azure OpenAi is configured, set it as the default provider
-if os.getenv("AZURE_OPENAI_API_KEY"):
-    litellm.api_key = os.getenv("AZURE_OPENAI_API_KEY")
+@lru_cache(maxsize=None)
+def get_litellm() -> ModuleType:
+    """Import and configure litellm on first use.
+
+    litellm takes seconds to import, so it is only loaded once a workflow makes an LLM,
+    embedding or reranking call, rather than whenever this module is imported.
+    """
+    import litellm
+
+    # uncomment for debugging litellm issues
+    # litellm.set_verbose=True
+
+    # Enable parameter dropping for unsupported parameters
+    litellm.drop_params = True
+
+    # Set OpenAI base URL if provided
+    openai_base_url = os.getenv("OPENAI_API_BASE")
+    if openai_base_url:
+        litellm.api_base = openai_base_url
+
+    # If Azure OpenAi is configured, set it as the default provider
+    if os.getenv("AZURE_OPENAI_API_KEY"):
+        litellm.api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    return litellm
 
 
 class ModelInfo(BaseModel):
@@ -66,21 +90,43 @@ class ModelInfo(BaseModel):
     )
 
 
+def create_few_shot_messages(
+    few_shot_examples: Optional[List[Dict[str, str]]],
+) -> List[Dict[str, str]]:
+    """Turn few-shot examples into alternating user and assistant messages.
+
+    Nodes build these once from their config and pass them to create_messages on each run.
+    """
+    return [
+        message
+        for example in few_shot_examples or ()
+        for message in (
+            {"role": "user", "content": example["input"]},
+            {"role": "assistant", "content": example["output"]},
+        )
+    ]
+
+
 def create_messages(
     system_message: str,
     user_message: str,
     few_shot_examples: Optional[List[Dict[str, str]]] = None,
     history: Optional[List[Dict[str, str]]] = None,
+    few_shot_messages: Optional[List[Dict[str, str]]] = None,
 ) -> List[Dict[str, str]]:
-    messages = [{"role": "system", "content": system_message}]
-    if few_shot_examples:
-        for example in few_shot_examples:
-            messages.append({"role": "user", "content": example["input"]})
-            messages.append({"role": "assistant", "content": example["output"]})
-    if history:
-        messages.extend(history)
-    messages.append({"role": "user", "content": user_message})
-    return messages
+    """Build the messages for an LLM call.
+
+    few_shot_messages, as returned by create_few_shot_messages, take the place of
+    few_shot_examples when given.
+    """
+    if few_shot_messages is None:
+        few_shot_messages = create_few_shot_messages(few_shot_examples)
+    return [
+        {"role": "system", "content": system_message},
+        *few_shot_messages,
+        *(history or ()),
+        {"role": "user", "content": user_message},
+    ]
 
 
 def create_messages_with_images(
@@ -139,7 +185,9 @@ def async_retry(*dargs, **dkwargs):
         r = AsyncRetrying(*dargs, **dkwargs)
 
         async def wrapped_f(*args, **kwargs):
-            async for attempt in r:
+            # AsyncRetrying keeps the state of the attempt in progress on itself, so each
+            # call iterates its own copy rather than sharing it with concurrent calls
+            async for attempt in r.copy():
                 with attempt:
                     return await f(*args, **kwargs)
 
@@ -148,19 +196,61 @@ def async_retry(*dargs, **dkwargs):
     return decorator
 
 
+@lru_cache(maxsize=256)
+def _model_provider(model: str) -> str:
+    """Return the provider prefix of a litellm model name, e.g. "ollama" for "ollama/llama3".
+
+    Model names without a prefix are OpenAI models.
+    """
+    return model.split("/", 1)[0] if "/" in model else "openai"
+
+
+# Upper bound of the per-provider limit, high enough not to hold back concurrent nodes
+_LLM_MAX_CONCURRENCY = 256
+
+
+async def _acompletion(**kwargs: Any) -> Any:
+    """Call litellm's acompletion through the rate limiter of the model's provider.
+
+    Concurrent LLM nodes hitting the same provider share one adaptive limit. It starts at
+    its maximum, so calls are not held back until the provider answers with rate limit
+    errors; it then backs off and grows again while calls succeed.
+    """
+    provider = _model_provider(kwargs.get("model", ""))
+    litellm = get_litellm()
+    async with get_rate_limiter(
+        f"llm:{provider}", initial_limit=_LLM_MAX_CONCURRENCY, max_limit=_LLM_MAX_CONCURRENCY
+    ):
+        return await litellm.acompletion(**kwargs, drop_params=True)
+
+
+@lru_cache(maxsize=None)
+def _non_retryable_errors() -> Tuple[Type[Exception], ...]:
+    """Return the errors completion_with_backoff gives up on, as retrying cannot help."""
+    litellm = get_litellm()
+    return (
+        litellm.exceptions.AuthenticationError,
+        ValueError,
+        litellm.exceptions.RateLimitError,
+    )
+
+
+def _use_azure(model: str) -> bool:
+    """Return whether a model is called through Azure OpenAI.
+
+    That is when the model has the azure/ prefix, or when an Azure API key is set and the
+    model is not served by Ollama.
+    """
+    provider = _model_provider(model)
+    return provider == "azure" or (bool(os.getenv("AZURE_OPENAI_API_KEY")) and provider != "ollama")
+
+
 @async_retry(
     wait=wait_random_exponential(min=30, max=120),
     stop=stop_after_attempt(3),
-    retry=lambda e: not isinstance(
-        e,
-        (
-            litellm.exceptions.AuthenticationError,
-            ValueError,
-            litellm.exceptions.RateLimitError,
-        ),
-    ),
+    retry=retry_if_exception(lambda e: not isinstance(e, _non_retryable_errors())),
 )
-async def completion_with_backoff(**kwargs) -> Message:
+async def completion_with_backoff(**kwargs) -> "Message":
     """Call the LLM completion endpoint with backoff.
 
     Supports Azure OpenAI, standard OpenAI, or Ollama based on the model name.
@@ -168,42 +258,26 @@ async def completion_with_backoff(**kwargs) -> Message:
     try:
         model = kwargs.get("model", "")
         logging.info("=== LLM Request Configuration ===")
-        logging.info(f"Requested Model: {model}")
-
-        # Use Azure if either 'azure/' is prefixed or if an Azure API key
-        # is provided and not using Ollama
-        if model.startswith("azure/") or (
-            os.getenv("AZURE_OPENAI_API_KEY") and not model.startswith("ollama/")
-        ):
-            azure_kwargs = setup_azure_configuration(kwargs)
-            logging.info(f"Using Azure config for model: {azure_kwargs['model']}")
-            try:
-                response = await acompletion(**azure_kwargs, drop_params=True)
-                return response.choices[0].message.content
-            except Exception as e:
-                logging.error(f"Error calling Azure OpenAI: {e}")
-                raise
-
-        elif model.startswith("ollama/"):
-            logging.info("=== Ollama Configuration ===")
-            response = await acompletion(**kwargs, drop_params=True)
-            return response.choices[0].message
-        else:
-            logging.info("=== Standard Configuration ===")
-            response = await acompletion(**kwargs, drop_params=True)
-            return response.choices[0].message
+        logging.info("Requested Model: %s", model)
+
+        request_kwargs = kwargs
+        if _use_azure(model):
+            request_kwargs = setup_azure_configuration(kwargs)
+            logging.info("Using Azure config for model: %s", request_kwargs["model"])
+        response = await _acompletion(**request_kwargs)
+        return response.choices[0].message
 
     except Exception as e:
         logging.error("=== LLM Request Error ===")
         # Create a save copy of kwargs without sensitive information
         save_config = kwargs.copy()
         save_config["api_key"] = "********" if "api_key" in save_config else None
-        logging.error(f"Error occurred with configuration: {save_config}")
-        logging.error(f"Error type: {type(e).__name__}")
-        logging.error(f"Error message: {str(e)}")
+        logging.error("Error occurred with configuration: %s", save_config)
+        logging.error("Error type: %s", type(e).__name__)
+        logging.error("Error message: %s", e)
         if hasattr(e, "response"):
-            logging.error(f"Response status: {getattr(e.response, 'status_code', 'N/A')}")
-            logging.error(f"Response body: {getattr(e.response, 'text', 'N/A')}")
+            logging.error("Response status: %s", getattr(e.response, "status_code", "N/A"))
+            logging.error("Response body: %s", getattr(e.response, "text", "N/A"))
         raise e
 
 
@@ -228,6 +302,108 @@ def sanitize_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
     return schema
 
 
+def _parse_json(text: str) -> Any:
+    """Parse JSON with orjson, falling back to json for what only it accepts, like NaN."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def dump_input_json(data: Dict[str, Any]) -> str:
+    """Serialize node input as indented JSON for a user message.
+
+    Uses orjson, falling back to json for what only it encodes, like integers past 64 bits.
+    """
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(data, indent=2)
+
+
+# Outermost {...} block of a response that has text around its JSON
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Output schema used when the caller gives none
+_DEFAULT_OUTPUT_JSON_SCHEMA = json.dumps(
+    {
+        "type": "object",
+        "properties": {"output": {"type": "string"}},
+        "required": ["output"],
+        "additionalProperties": False,
+    }
+)
+
+
+# Appended, with the schema, to the system message of models that only take JSON mode
+_JSON_MODE_INSTRUCTIONS = (
+    "\nYou must respond with valid JSON only."
+    " No other text before or after the JSON Object."
+    "The JSON Object must adhere to this schema: "
+)
+
+
+@lru_cache(maxsize=256)
+def _prepare_output_json_schema(output_json_schema: str) -> str:
+    """Sanitize an output JSON schema for the providers, once per schema string.
+
+    The result is returned serialized, so it doubles as the schema text for the prompt and
+    each call can parse its own copy.
+    """
+    schema = sanitize_json_schema(json.loads(output_json_schema))
+    schema["additionalProperties"] = False
+    return json.dumps(schema)
+
+
+@lru_cache(maxsize=256)
+def _supported_params(model_name: str, provider: str) -> FrozenSet[str]:
+    """Return the OpenAI parameters litellm supports for a model, looked up once per model."""
+    return frozenset(
+        get_litellm().get_supported_openai_params(model=model_name, custom_llm_provider=provider)
+        or ()
+    )
+
+
+@lru_cache(maxsize=256)
+def _supports_response_schema(model_name: str, provider: str) -> bool:
+    """Return whether litellm supports response schemas for a model, once per model."""
+    return get_litellm().supports_response_schema(model=model_name, custom_llm_provider=provider)
+
+
+@lru_cache(maxsize=256)
+def _build_response_format(model_name: str, provider: str, schema: str) -> Optional[str]:
+    """Return the serialized response_format for a model and output schema, if it takes one.
+
+    Models that support response schemas get the schema itself; other models that support
+    response_format get JSON mode, and the schema has to be given in the prompt instead.
+    The result is serialized so that each call can parse its own copy.
+    """
+    if "response_format" not in _supported_params(model_name, provider):
+        return None
+    if not _supports_response_schema(model_name, provider) and not model_name.startswith(
+        "anthropic"
+    ):
+        return json.dumps({"type": "json_object"})
+
+    json_schema = orjson.loads(schema)
+    if "name" not in json_schema and "schema" not in json_schema:
+        json_schema = {"schema": json_schema, "strict": True, "name": "output"}
+    return json.dumps({"type": "json_schema", "json_schema": json_schema})
+
+
+def _wrap_output(output: str, raw_response: Any) -> str:
+    """Wrap a plain text response as a JSON object, with any provider-specific fields.
+
+    json.dumps escapes every character JSON requires, not just quotes and newlines.
+    """
+    wrapped: Dict[str, Any] = {"output": output}
+    # Check for provider-specific fields
+    choices = getattr(raw_response, "choices", None)
+    if choices and hasattr(choices[0].message, "provider_specific_fields"):
+        wrapped["provider_specific_fields"] = choices[0].message.provider_specific_fields
+    return json.dumps(wrapped)
+
+
 async def generate_text(
     messages: List[Dict[str, str]],
     model_name: str,
@@ -240,7 +416,7 @@ async def generate_text(
     tools: Optional[List[Dict[str, Any]]] = None,
     tool_choice: Optional[str] = "auto",
     thinking: Optional[Dict[str, Any]] = None,
-) -> Message:
+) -> "Message":
     """Generate text using the specified LLM model.
 
     Args:
@@ -296,50 +472,24 @@ async def generate_text(
     # Only process JSON schema if the model supports it
     if supports_json:
         if output_json_schema is None:
-            output_json_schema = {
-                "type": "object",
-                "properties": {"output": {"type": "string"}},
-                "required": ["output"],
-            }
+            schema_for_prompt = _DEFAULT_OUTPUT_JSON_SCHEMA
         elif output_json_schema.strip() != "":
-            output_json_schema = json.loads(output_json_schema)
-            output_json_schema = sanitize_json_schema(output_json_schema)
+            schema_for_prompt = _prepare_output_json_schema(output_json_schema)
         else:
             raise ValueError("Invalid output schema", output_json_schema)
-        output_json_schema["additionalProperties"] = False
 
         # check if the model supports response format
-        if "response_format" in litellm.get_supported_openai_params(
-            model=model_name, custom_llm_provider=model_info.provider
-        ):
-            if litellm.supports_response_schema(
-                model=model_name, custom_llm_provider=model_info.provider
-            ) or model_name.startswith("anthropic"):
-                if "name" not in output_json_schema and "schema" not in output_json_schema:
-                    output_json_schema = {
-                        "schema": output_json_schema,
-                        "strict": True,
-                        "name": "output",
-                    }
-                kwargs["response_format"] = {
-                    "type": "json_schema",
-                    "json_schema": output_json_schema,
-                }
-            else:
-                kwargs["response_format"] = {"type": "json_object"}
-                schema_for_prompt = json.dumps(output_json_schema)
+        response_format = _build_response_format(model_name, model_info.provider, schema_for_prompt)
+        if response_format is not None:
+            kwargs["response_format"] = orjson.loads(response_format)
+            if kwargs["response_format"]["type"] == "json_object":
                 system_message = next(
                     message for message in messages if message["role"] == "system"
                 )
-                system_message["content"] += (
-                    "\nYou must respond with valid JSON only."
-                    + " No other text before or after the JSON Object."
-                    + "The JSON Object must adhere to this schema: "
-                    + schema_for_prompt
-                )
+                system_message["content"] += _JSON_MODE_INSTRUCTIONS + schema_for_prompt
 
     if json_mode and supports_json:
-        if model_name.startswith("ollama"):
+        if _model_provider(model_name) == "ollama":
             if api_base is None:
                 api_base = os.getenv("OLLAMA_BASE_URL")
             options = OllamaOptions(temperature=temperature, max_tokens=max_tokens)
@@ -351,7 +501,7 @@ async def generate_text(
                 api_base=api_base,
             )
             response = raw_response
-            message_response = Message(
+            message_response = get_litellm().Message(
                 content=json.dumps(raw_response),
                 tool_calls=[],
             )
@@ -367,51 +517,27 @@ async def generate_text(
                     }"""
                 )
 
+            # Encode each attached file once, in a worker thread so that reading and encoding
+            # a large file does not block the event loop
+            attachment_urls = [
+                url
+                if is_external_url(url) or url.startswith("data:")
+                else await asyncio.to_thread(_file_to_data_url, url)
+                for url in url_variables.values()
+                if url  # Only add if URL is provided
+            ]
+
             # Transform messages to include URL content
             transformed_messages = []
             for msg in messages:
                 if msg["role"] == "user":
                     content = [{"type": "text", "text": msg["content"]}]
                     # Add any URL variables as image_url or other supported types
-                    for _, url in url_variables.items():
-                        if url:  # Only add if URL is provided
-                            # Check if the URL is a base64 data URL
-                            if is_external_url(url) or url.startswith("data:"):
-                                content.append(
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {"url": url},
-                                    }
-                                )
-                            else:
-                                # For file paths, encode the file with appropriate MIME type
-                                try:
-                                    # Use the new path resolution utility
-                                    file_path = resolve_file_path(url)
-                                    logging.info(f"Reading file from: {file_path}")
-
-                                    # Check if file is a DOCX file
-                                    if str(file_path).lower().endswith(".docx"):
-                                        # Convert DOCX to XML
-                                        xml_content = convert_docx_to_xml(str(file_path))
-                                        # Encode the XML content directly
-                                        data_url = (
-                                            f"data:text/xml;base64,"
-                                            f"{base64.b64encode(xml_content.encode()).decode()}"
-                                        )
-                                    else:
-                                        data_url = encode_file_to_base64_data_url(str(file_path))
-
-                                    content.append(
-                                        {
-                                            "type": "image_url",
-                                            "image_url": {"url": data_url},
-                                        }
-                                    )
-                                except Exception as e:
-                                    logging.error(f"Error reading file {url}: {str(e)}")
-                                    raise
-                    msg["content"] = content
+                    content.extend(
+                        {"type": "image_url", "image_url": {"url": url}} for url in attachment_urls
+                    )
+                    # A new dict, as few-shot and history messages are shared between calls
+                    msg = {**msg, "content": content}
                 transformed_messages.append(msg)
             kwargs["messages"] = transformed_messages
             message_response: Message = await completion_with_backoff(**kwargs)
@@ -422,7 +548,7 @@ async def generate_text(
             response = message_response.content
             raw_response = response
     else:
-        if model_name.startswith("ollama"):
+        if _model_provider(model_name) == "ollama":
             if api_base is None:
                 api_base = os.getenv("OLLAMA_BASE_URL")
             options = OllamaOptions(temperature=temperature, max_tokens=max_tokens)
@@ -434,33 +560,21 @@ async def generate_text(
                 api_base=api_base,
             )
             response = raw_response
-            message_response = Message(
+            message_response = get_litellm().Message(
                 content=json.dumps(raw_response),
                 tool_calls=[],
             )
         else:
             message_response: Message = await completion_with_backoff(**kwargs)
             response = message_response.content
+            raw_response = response
 
     # For models that don't support JSON output, wrap the response in a JSON structure
     if not supports_json:
-        sanitized_response = response.replace('"', '\\"').replace("\n", "\\n")
         if model_info and model_info.constraints.supports_reasoning:
             separator = model_info.constraints.reasoning_separator
-            sanitized_response = re.sub(separator, "", sanitized_response, flags=re.DOTALL)
-
-        # Check for provider-specific fields
-        if hasattr(raw_response, "choices") and len(raw_response.choices) > 0:
-            if hasattr(raw_response.choices[0].message, "provider_specific_fields"):
-                provider_fields = raw_response.choices[0].message.provider_specific_fields
-                message_response.content = json.dumps(
-                    {
-                        "output": sanitized_response,
-                        "provider_specific_fields": provider_fields,
-                    }
-                )
-                return message_response
-        message_response.content = f'{{"output": "{sanitized_response}"}}'
+            response = re.sub(separator, "", response, flags=re.DOTALL)
+        message_response.content = _wrap_output(response, raw_response)
         return message_response
 
     # Ensure response is valid JSON for models that support it
@@ -471,42 +585,43 @@ async def generate_text(
                 return message_response
             else:
                 # Attempt to parse the response as JSON to validate it
-                _ = json.loads(response)
+                _parse_json(response)
                 return message_response
         except json.JSONDecodeError:
             logging.error(f"Response is not valid JSON: {response}")
             # Try to fix common json issues
             if not response.startswith("{"):
                 # Extract JSON if there is extra text
-                json_match = re.search(r"\{.*\}", response, re.DOTALL)
+                json_match = _JSON_BLOCK_RE.search(response)
                 if json_match:
                     response = json_match.group(0)
                     try:
-                        json.loads(response)
+                        _parse_json(response)
                         message_response.content = response
                         return message_response
                     except json.JSONDecodeError:
                         pass
 
             # If all attempts to parse JSON fail, wrap the response in a JSON structure
-            sanitized_response = response.replace('"', '\\"').replace("\n", "\\n")
-            # Check for provider-specific fields
-            if hasattr(raw_response, "choices") and len(raw_response.choices) > 0:
-                if hasattr(raw_response.choices[0].message, "provider_specific_fields"):
-                    provider_fields = raw_response.choices[0].message.provider_specific_fields
-                    message_response.content = json.dumps(
-                        {
-                            "output": sanitized_response,
-                            "provider_specific_fields": provider_fields,
-                        }
-                    )
-                    return message_response
-            message_response.content = f'{{"output": "{sanitized_response}"}}'
+            message_response.content = _wrap_output(response, raw_response)
             return message_response
 
     return message_response
 
 
+# JSON schema type for each type name allowed in a simple output schema
+_SIMPLE_TYPE_TO_JSON_SCHEMA_TYPE = {
+    "str": "string",
+    "string": "string",
+    "int": "integer",
+    "integer": "integer",
+    "float": "number",
+    "number": "number",
+    "bool": "boolean",
+    "boolean": "boolean",
+}
+
+
 def convert_output_schema_to_json_schema(
     output_schema: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -515,23 +630,16 @@ def convert_output_schema_to_json_schema(
     Simple output schema is a dictionary with field names and types.
     Types can be one of 'str', 'int', 'float' or 'bool'.
     """
-    json_schema = {
+    properties: Dict[str, Any] = {}
+    for field, field_type in output_schema.items():
+        if isinstance(field_type, str) and field_type in _SIMPLE_TYPE_TO_JSON_SCHEMA_TYPE:
+            properties[field] = {"type": _SIMPLE_TYPE_TO_JSON_SCHEMA_TYPE[field_type]}
+    return {
         "type": "object",
-        "properties": {},
-        "required": [],
+        "properties": properties,
+        "required": list(output_schema),
         "additionalProperties": False,
     }
-    for field, field_type in output_schema.items():
-        if field_type == "str" or field_type == "string":
-            json_schema["properties"][field] = {"type": "string"}
-        elif field_type == "int" or field_type == "integer":
-            json_schema["properties"][field] = {"type": "integer"}
-        elif field_type == "float" or field_type == "number":
-            json_schema["properties"][field] = {"type": "number"}
-        elif field_type == "bool" or field_type == "boolean":
-            json_schema["properties"][field] = {"type": "boolean"}
-        json_schema["required"].append(field)
-    return json_schema
 
 
 def encode_image(image_path: str) -> str:
@@ -539,6 +647,37 @@ def encode_image(image_path: str) -> str:
         return base64.b64encode(image_file.read()).decode("utf-8")
 
 
+# Ollama clients of each event loop, by host, so calls reuse kept-alive connections
+_OllamaClients = Dict[Optional[str], "AsyncClient"]
+_ollama_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, _OllamaClients]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_ollama_client(api_base: Optional[str]) -> "AsyncClient":
+    """Return the Ollama client for a host on the running event loop, creating it once."""
+    from ollama import AsyncClient
+
+    clients = _ollama_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_base)
+    if client is None:
+        client = AsyncClient(
+            host=api_base,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        clients[api_base] = client
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Close the pooled Ollama clients of the running event loop, if any were created.
+
+    litellm's own clients are left to litellm, which creates and caches them itself.
+    """
+    for client in _ollama_clients.pop(asyncio.get_running_loop(), {}).values():
+        await client._client.aclose()
+
+
 @async_retry(wait=wait_random_exponential(min=30, max=120), stop=stop_after_attempt(3))
 async def ollama_with_backoff(
     model: str,
@@ -560,7 +699,7 @@ async def ollama_with_backoff(
         Either a string response or a validated Pydantic model instance
 
     """
-    client = AsyncClient(host=api_base)
+    client = _get_ollama_client(api_base)
     try:
         response = await client.chat(
             model=model.replace("ollama/", ""),
@@ -574,6 +713,25 @@ async def ollama_with_backoff(
         raise e
 
 
+def _file_to_data_url(url: str) -> str:
+    """Read a file referenced by a URL variable and encode it as a base64 data URL."""
+    try:
+        # Use the new path resolution utility
+        file_path = resolve_file_path(url)
+        logging.info(f"Reading file from: {file_path}")
+
+        # Check if file is a DOCX file
+        if str(file_path).lower().endswith(".docx"):
+            # Convert DOCX to XML
+            xml_content = convert_docx_to_xml(str(file_path))
+            # Encode the XML content directly
+            return f"data:text/xml;base64,{base64.b64encode(xml_content.encode()).decode()}"
+        return encode_file_to_base64_data_url(str(file_path))
+    except Exception as e:
+        logging.error(f"Error reading file {url}: {str(e)}")
+        raise
+
+
 def convert_docx_to_xml(file_path: str) -> str:
     """Convert a DOCX file to XML format.
 
@@ -1,17 +1,16 @@
 import asyncio
 import json
 import pprint
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
-from jinja2 import Template
-from litellm import ChatCompletionMessageToolCall, ChatCompletionToolMessage
 from pydantic import BaseModel, Field
 
 from ...schemas.workflow_schemas import WorkflowDefinitionSchema, WorkflowNodeSchema
 from ...utils.pydantic_utils import get_nested_field
 from ..base import BaseNode, BaseNodeInput, BaseNodeOutput, VisualTag
 from ..factory import NodeFactory
-from ._utils import create_messages, generate_text
+from ..utils.template_utils import get_template
+from ._utils import create_messages, dump_input_json, generate_text, get_litellm
 from .single_llm_call import (
     LLMModels,
     ModelInfo,
@@ -20,6 +19,9 @@ from .single_llm_call import (
     repair_json,
 )
 
+if TYPE_CHECKING:
+    from litellm import ChatCompletionMessageToolCall, ChatCompletionToolMessage
+
 
 class AgentNodeConfig(SingleLLMCallNodeConfig):
     """Configuration for the AgentNode.
@@ -119,7 +121,7 @@ class AgentNode(SingleLLMCallNode):
     def _render_template(self, template_str: str, data: Dict[str, Any]) -> str:
         """Render a template with the given data."""
         try:
-            return Template(template_str).render(**data)
+            return get_template(template_str).render(**data)
         except Exception as e:
             print(f"[ERROR] Failed to render template: {e}")
             return template_str
@@ -138,7 +140,7 @@ class AgentNode(SingleLLMCallNode):
                 tool_schema = tool_node_instance.function_schema
             self.tools_schemas.append(tool_schema)
 
-    async def _call_tool(self, tool_call: ChatCompletionMessageToolCall) -> Any:
+    async def _call_tool(self, tool_call: "ChatCompletionMessageToolCall") -> Any:
         """Call a tool with the provided parameters."""
         tool_name = tool_call.function.name
         tool_args = tool_call.function.arguments
@@ -163,16 +165,16 @@ class AgentNode(SingleLLMCallNode):
         return await tool_node_instance.call_as_tool(arguments=tool_args)
 
     async def execute_parallel_tool_calls(
-        self, tool_calls: List[ChatCompletionMessageToolCall]
-    ) -> List[ChatCompletionToolMessage]:
+        self, tool_calls: List["ChatCompletionMessageToolCall"]
+    ) -> List["ChatCompletionToolMessage"]:
         """Execute multiple tool calls in parallel."""
 
         # Create async tasks for all tool calls to execute them concurrently
         async def process_tool_call(
-            tool_call: ChatCompletionMessageToolCall,
-        ) -> ChatCompletionToolMessage:
+            tool_call: "ChatCompletionMessageToolCall",
+        ) -> "ChatCompletionToolMessage":
             tool_response = await self._call_tool(tool_call)
-            return ChatCompletionToolMessage(
+            return get_litellm().ChatCompletionToolMessage(
                 role="tool",
                 content=str(tool_response),
                 tool_call_id=tool_call.id,
@@ -189,13 +191,15 @@ class AgentNode(SingleLLMCallNode):
         raw_input_dict = input.model_dump()
 
         # Render the system message with the input data
-        system_message = self._render_template(self.config.system_message, raw_input_dict)
+        system_message = self._static_system_message
+        if system_message is None:
+            system_message = self._render_template(self.config.system_message, raw_input_dict)
         try:
             # If user_message is empty, dump the entire raw dictionary
             if not self.config.user_message.strip():
-                user_message = json.dumps(raw_input_dict, indent=2)
+                user_message = dump_input_json(raw_input_dict)
             else:
-                user_message = Template(self.config.user_message).render(**raw_input_dict)
+                user_message = get_template(self.config.user_message).render(**raw_input_dict)
         except Exception as e:
             print(f"[ERROR] Failed to render user_message {self.name}")
             print(f"[ERROR] user_message: {self.config.user_message} with input: {raw_input_dict}")
@@ -224,8 +228,8 @@ class AgentNode(SingleLLMCallNode):
         messages: List[Dict[str, Any]] = create_messages(
             system_message=system_message,
             user_message=user_message,
-            few_shot_examples=self.config.few_shot_examples,
             history=history,
+            few_shot_messages=self._few_shot_messages,
         )
 
         model_name = LLMModels(self.config.llm_info.model).value
@@ -53,8 +53,24 @@ class BestOfNNode(BaseSubworkflowNode):
     input_model = BestOfNNodeInput
     output_model = BestOfNNodeOutput
 
+    def _sample_count(self) -> int:
+        """Return how many responses to generate and rate.
+
+        At temperature 0 every sample is the same response, so only one is generated and rated.
+        """
+        llm_info = self.config.llm_info
+        model_info = LLMModels.get_model_info(llm_info.model)
+        if (
+            llm_info.temperature == 0
+            and model_info is not None
+            and model_info.constraints.supports_temperature
+            and llm_info.model != LLMModels.DEEPSEEK_REASONER
+        ):
+            return 1
+        return self.config.samples
+
     def setup_subworkflow(self) -> None:
-        samples = self.config.samples
+        samples = self._sample_count()
 
         # Generate the nodes for the subworkflow
         nodes: List[WorkflowNodeSchema] = []
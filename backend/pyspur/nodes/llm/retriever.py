@@ -1,7 +1,6 @@
 import json
 from typing import Dict, List
 
-from jinja2 import Template
 from loguru import logger
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -20,6 +19,7 @@ from ..base import (
     BaseNodeInput,
     BaseNodeOutput,
 )
+from ..utils.template_utils import get_template
 
 # Todo: Use Fixed Node Output; where the outputs will always be chunks
 
@@ -130,7 +130,7 @@ class RetrieverNode(BaseNode):
 
             # Render query template with input variables
             raw_input_dict = input.model_dump()
-            query = Template(self.config.query_template).render(**raw_input_dict)
+            query = get_template(self.config.query_template).render(**raw_input_dict)
 
             # Create retrieval request
             results = await vector_index.retrieve(
@@ -1,27 +1,45 @@
 import json
+import re
+from re import Match
 from typing import Dict, List, Optional
 
+import orjson
 from dotenv import load_dotenv
-from jinja2 import Template
 from pydantic import BaseModel, Field
 
-from ...utils.pydantic_utils import get_nested_field, json_schema_to_model
+from ...utils.pydantic_utils import get_nested_field
 from ..base import (
     BaseNode,
     BaseNodeConfig,
     BaseNodeInput,
     BaseNodeOutput,
+    output_model_from_json_schema,
+)
+from ..utils.template_utils import get_template, get_template_variables
+from ._utils import (
+    LLMModels,
+    ModelInfo,
+    create_few_shot_messages,
+    create_messages,
+    dump_input_json,
+    generate_text,
 )
-from ._utils import LLMModels, ModelInfo, create_messages, generate_text
 
 load_dotenv()
 
+# Patterns used by repair_json, compiled once at import time
+_LLM_ARTIFACT_TAG_RE = re.compile(r"</?(invoke|function_call|thinking).*?>")
+_CODE_FENCE_RE = re.compile(r"^```(json)?|```$", flags=re.MULTILINE)
+_JSON_OBJECT_RE = re.compile(r"(\{[\s\S]*\})")
+_DOUBLE_QUOTED_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_MISSING_COMMA_RE = re.compile(r"([}\"])\s*([{\[])")
+_UNQUOTED_KEY_RE = re.compile(r"([{,]\s*)(\w+)(\s*:)")
+_COLON_WHITESPACE_RE = re.compile(r"\s*:\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
 
-def repair_json(broken_json_str: str) -> str:
-    import re
-    from re import Match
-    from typing import Dict
 
+def repair_json(broken_json_str: str) -> str:
     # Handle empty or non-string input
     if not broken_json_str or not broken_json_str.strip():
         return "{}"
@@ -29,13 +47,13 @@ def repair_json(broken_json_str: str) -> str:
     repaired = broken_json_str
 
     # Remove common LLM artifacts like XML/markdown tags that might be mixed in with JSON
-    repaired = re.sub(r"</?(invoke|function_call|thinking).*?>", "", repaired)
+    repaired = _LLM_ARTIFACT_TAG_RE.sub("", repaired)
 
     # Remove markdown code block markers if present
-    repaired = re.sub(r"^```(json)?|```$", "", repaired, flags=re.MULTILINE)
+    repaired = _CODE_FENCE_RE.sub("", repaired)
 
     # Try to extract just the JSON part if it's mixed with other text
-    json_match = re.search(r"(\{[\s\S]*\})", repaired)
+    json_match = _JSON_OBJECT_RE.search(repaired)
     if json_match:
         repaired = json_match.group(1)
 
@@ -53,7 +71,7 @@ def repair_json(broken_json_str: str) -> str:
         return key
 
     # Temporarily store valid double-quoted strings
-    repaired = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', replace_quoted, repaired)
+    repaired = _DOUBLE_QUOTED_STRING_RE.sub(replace_quoted, repaired)
 
     # Now convert remaining single quotes to double quotes
     repaired = repaired.replace("'", '"')
@@ -63,16 +81,16 @@ def repair_json(broken_json_str: str) -> str:
         repaired = repaired.replace(key, value)
 
     # Remove trailing commas before closing brackets/braces
-    repaired = re.sub(r",\s*([}\]])", r"\1", repaired)
+    repaired = _TRAILING_COMMA_RE.sub(r"\1", repaired)
 
     # Add missing commas between elements
-    repaired = re.sub(r"([}\"])\s*([{\[])", r"\1,\2", repaired)
+    repaired = _MISSING_COMMA_RE.sub(r"\1,\2", repaired)
 
     # Fix unquoted string values
-    repaired = re.sub(r"([{,]\s*)(\w+)(\s*:)", r'\1"\2"\3', repaired)
+    repaired = _UNQUOTED_KEY_RE.sub(r'\1"\2"\3', repaired)
 
     # Remove any extra whitespace around colons
-    repaired = re.sub(r"\s*:\s*", ":", repaired)
+    repaired = _COLON_WHITESPACE_RE.sub(":", repaired)
 
     # If the string is wrapped in extra quotes, remove them
     if repaired.startswith('"') and repaired.endswith('"'):
@@ -88,7 +106,7 @@ def repair_json(broken_json_str: str) -> str:
         return "{}"
 
     # Final cleanup of whitespace
-    repaired = re.sub(r"\s+", " ", repaired)
+    repaired = _WHITESPACE_RE.sub(" ", repaired)
 
     return repaired
 
@@ -161,26 +179,42 @@ class SingleLLMCallNode(BaseNode):
 
     def setup(self) -> None:
         super().setup()
+        self._prepare_messages()
         if self.config.output_json_schema:
-            self.output_model = json_schema_to_model(
-                json.loads(self.config.output_json_schema),
-                self.name,
-                SingleLLMCallNodeOutput,
-            )  # type: ignore
+            self.output_model = output_model_from_json_schema(
+                self.config.output_json_schema, self.name, SingleLLMCallNodeOutput
+            )
+
+    def update_config(self, config: BaseNodeConfig) -> None:
+        super().update_config(config)
+        self._prepare_messages()
+
+    def _prepare_messages(self) -> None:
+        """Build the parts of the LLM messages that depend only on the config."""
+        self._few_shot_messages = create_few_shot_messages(self.config.few_shot_examples)
+        # A system message that reads no inputs renders the same on every run
+        self._static_system_message: Optional[str] = None
+        try:
+            if not get_template_variables(self.config.system_message):
+                self._static_system_message = get_template(self.config.system_message).render()
+        except Exception:
+            pass  # Left to run(), which reports template errors
 
     async def run(self, input: BaseModel) -> BaseModel:
         # Grab the entire dictionary from the input
         raw_input_dict = input.model_dump()
 
         # Render system_message
-        system_message = Template(self.config.system_message).render(raw_input_dict)
+        system_message = self._static_system_message
+        if system_message is None:
+            system_message = get_template(self.config.system_message).render(raw_input_dict)
 
         try:
             # If user_message is empty, dump the entire raw dictionary
             if not self.config.user_message.strip():
-                user_message = json.dumps(raw_input_dict, indent=2)
+                user_message = dump_input_json(raw_input_dict)
             else:
-                user_message = Template(self.config.user_message).render(**raw_input_dict)
+                user_message = get_template(self.config.user_message).render(**raw_input_dict)
         except Exception as e:
             print(f"[ERROR] Failed to render user_message {self.name}")
             print(f"[ERROR] user_message: {self.config.user_message} with input: {raw_input_dict}")
@@ -209,8 +243,8 @@ class SingleLLMCallNode(BaseNode):
         messages = create_messages(
             system_message=system_message,
             user_message=user_message,
-            few_shot_examples=self.config.few_shot_examples,
             history=history,
+            few_shot_messages=self._few_shot_messages,
         )
 
         model_name = LLMModels(self.config.llm_info.model).value
@@ -255,8 +289,15 @@ class SingleLLMCallNode(BaseNode):
             if assistant_message_content is None:
                 raise ValueError("Assistant message content is None")
 
+            # Well-formed responses are parsed and validated in one pass; anything else
+            # goes through the repair path below and is validated there
+            try:
+                return self.output_model.model_validate_json(assistant_message_content)
+            except ValueError:
+                pass
+
             try:
-                assistant_message_dict = json.loads(assistant_message_content)
+                assistant_message_dict = orjson.loads(assistant_message_content)
             except Exception:
                 try:
                     repaired_str = repair_json(assistant_message_content)
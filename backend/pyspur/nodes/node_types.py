@@ -1,4 +1,5 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from ..schemas.node_type_schemas import NodeTypeSchema
 from .registry import NodeRegistry
@@ -123,6 +124,11 @@ SUPPORTED_NODE_TYPES = {
             "module": ".nodes.integrations.github.github_get_pull_request_changes",
             "class_name": "GitHubGetPullRequestChangesNode",
         },
+        {
+            "node_type_name": "GitHubBatchPullRequestsNode",
+            "module": ".nodes.integrations.github.github_batch_pull_requests",
+            "class_name": "GitHubBatchPullRequestsNode",
+        },
         {
             "node_type_name": "GitHubCreateIssueNode",
             "module": ".nodes.integrations.github.github_create_issue",
@@ -240,34 +246,42 @@ DEPRECATED_NODE_TYPES = [
 ]
 
 
+# Flat indexes over the configured node types so lookups don't scan every group
+SUPPORTED_NODE_TYPE_INDEX: Dict[str, Tuple[str, str]] = {
+    node_type["node_type_name"]: (node_type["module"], node_type["class_name"])
+    for node_types in SUPPORTED_NODE_TYPES.values()
+    for node_type in node_types
+}
+_DEPRECATED_NODE_TYPE_NAMES = frozenset(
+    node_type["node_type_name"] for node_type in DEPRECATED_NODE_TYPES
+)
+
+
+@lru_cache(maxsize=None)
+def _supported_node_type_schemas() -> Tuple[Tuple[str, Tuple[NodeTypeSchema, ...]], ...]:
+    """Validate SUPPORTED_NODE_TYPES into schemas once; the table never changes."""
+    return tuple(
+        (
+            group_name,
+            tuple(NodeTypeSchema.model_validate(node_type_dict) for node_type_dict in node_types),
+        )
+        for group_name, node_types in SUPPORTED_NODE_TYPES.items()
+    )
+
+
 def get_all_node_types() -> Dict[str, List[NodeTypeSchema]]:
     """Return a dictionary of all available node types grouped by category."""
-    node_type_groups: Dict[str, List[NodeTypeSchema]] = {}
-    for group_name, node_types in SUPPORTED_NODE_TYPES.items():
-        node_type_groups[group_name] = []
-        for node_type_dict in node_types:
-            node_type = NodeTypeSchema.model_validate(node_type_dict)
-            node_type_groups[group_name].append(node_type)
-    return node_type_groups
+    # Callers extend the returned lists, so hand out fresh lists of the cached schemas
+    return {
+        group_name: list(node_types) for group_name, node_types in _supported_node_type_schemas()
+    }
 
 
 def is_valid_node_type(node_type_name: str) -> bool:
     """Check if a node type is valid (supported, deprecated, or registered via decorator)."""
     # Check configured nodes first
-    for node_types in SUPPORTED_NODE_TYPES.values():
-        for node_type in node_types:
-            if node_type["node_type_name"] == node_type_name:
-                return True
-
-    for node_type in DEPRECATED_NODE_TYPES:
-        if node_type["node_type_name"] == node_type_name:
-            return True
+    if node_type_name in SUPPORTED_NODE_TYPE_INDEX or node_type_name in _DEPRECATED_NODE_TYPE_NAMES:
+        return True
 
     # Check registry for decorator-registered nodes
-    registered_nodes = NodeRegistry.get_registered_nodes()
-    for nodes in registered_nodes.values():
-        for node in nodes:
-            if node.node_type_name == node_type_name:
-                return True
-
-    return False
+    return NodeRegistry.get_node_info(node_type_name) is not None
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Type
 
 from pydantic import BaseModel, create_model
 
@@ -31,6 +32,22 @@ class InputNodeOutput(BaseNodeOutput):
     pass
 
 
+@lru_cache(maxsize=256)
+def _output_model_for_fields(
+    model_name: str, fields: Tuple[Tuple[str, type], ...]
+) -> Type[BaseNodeOutput]:
+    """Create (or reuse) the output model for the given field names and types.
+
+    Every workflow run creates a fresh InputNode, but the shape of the workflow inputs rarely
+    changes, so the generated model is shared between runs.
+    """
+    return create_model(  # type: ignore
+        model_name,
+        __base__=BaseNodeOutput,
+        **{field_name: (field_type, ...) for field_name, field_type in fields},  # type: ignore
+    )
+
+
 class InputNode(BaseNode):
     """
     Node for defining dataset schema and using the output as input for other nodes.
@@ -54,11 +71,8 @@ class InputNode(BaseNode):
         if isinstance(input, dict):
             if not any(isinstance(value, BaseNodeOutput) for value in input.values()):
                 # create a new model based on the input dictionary
-                fields = {key: (type(value), ...) for key, value in input.items()}
-                self.output_model = create_model(  # type: ignore
-                    self.name,
-                    __base__=BaseNodeOutput,
-                    **fields,  # type: ignore
+                self.output_model = _output_model_for_fields(
+                    self.name, tuple((key, type(value)) for key, value in input.items())
                 )
                 return self.output_model.model_validate(input)  # type: ignore
         return await super().__call__(input)
@@ -8,6 +8,8 @@ from ..base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
 class StaticValueNodeConfig(BaseNodeConfig):
     values: Dict[str, Any]
 
+    model_config = {"frozen": True}
+
 
 class StaticValueNodeInput(BaseNodeInput):
     pass
@@ -39,7 +41,9 @@ class StaticValueNode(BaseNode):
         self.output_model = self.create_output_model_class(output_schema)
 
     async def run(self, input: BaseModel) -> BaseModel:
-        return self.output_model(**self.config.values)
+        # The values come from the already validated config and the output model was
+        # derived from their types, so skip re-validating them here
+        return self.output_model.model_construct(**self.config.values)
 
 
 if __name__ == "__main__":
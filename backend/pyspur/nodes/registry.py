@@ -22,6 +22,8 @@ class NodeRegistry:
     _decorator_registered_classes: Set[Type[BaseNode]] = (
         set()
     )  # Track classes registered via decorator
+    _discovered: bool = False  # Whether discover_nodes has already scanned the packages
+    _node_index: Dict[str, NodeInfo] = {}  # Registered nodes keyed by node type name
 
     @classmethod
     def register(
@@ -79,6 +81,8 @@ class NodeRegistry:
                 subcategory=subcategory,
             )
 
+            cls._node_index.setdefault(node_info.node_type_name, node_info)
+
             # Handle positioning
             nodes_list = cls._nodes[category]
             if position is not None:
@@ -119,21 +123,42 @@ class NodeRegistry:
     def get_registered_nodes(
         cls,
     ) -> Dict[str, List[NodeInfo]]:
-        """Get all registered nodes."""
-        cls.discover_nodes()
+        """Get all registered nodes.
+
+        Node discovery imports every module in the package, so it only runs on first use.
+        """
+        if not cls._discovered:
+            cls.discover_nodes()
         return cls._nodes
 
+    @classmethod
+    def get_node_info(cls, node_type_name: str) -> Optional[NodeInfo]:
+        """Get the registration info for a node type, or None if it is not registered."""
+        if not cls._discovered:
+            cls.discover_nodes()
+        return cls._node_index.get(node_type_name)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Force the next get_registered_nodes call to run node discovery again."""
+        cls._discovered = False
+
     @classmethod
     def _discover_in_directory(cls, base_path: Path, package_prefix: str) -> None:
         """Recursively discover nodes in a directory and its subdirectories.
 
         Only registers nodes that explicitly use the @NodeRegistry.register decorator.
         """
-        # Get all Python files in current directory
-        for item in base_path.iterdir():
-            if item.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
+        # Get all Python files in current directory. scandir entries carry the file type,
+        # so this avoids a stat call per entry.
+        with os.scandir(base_path) as entries:
+            items = list(entries)
+        for item in items:
+            if item.name.startswith("_"):
+                continue
+            if item.is_file() and item.name.endswith(".py"):
                 # Construct module name from package prefix and file name
-                module_name = f"{package_prefix}.{item.stem}"
+                module_name = f"{package_prefix}.{item.name[:-3]}"
 
                 try:
                     # Import module but don't register nodes - they'll self-register if decorated
@@ -142,9 +167,9 @@ class NodeRegistry:
                     logger.error(f"Failed to load module {module_name}: {e}")
 
             # Recursively process subdirectories
-            elif item.is_dir() and not item.name.startswith("_"):
+            elif item.is_dir():
                 subpackage = f"{package_prefix}.{item.name}"
-                cls._discover_in_directory(item, subpackage)
+                cls._discover_in_directory(Path(item.path), subpackage)
 
     @classmethod
     def discover_nodes(cls, package_path: str = "pyspur.nodes") -> None:
@@ -169,6 +194,7 @@ class NodeRegistry:
 
             # Also discover tool function nodes
             cls.discover_tool_functions()
+            cls._discovered = True
 
             logger.info(
                 "Node discovery complete."
@@ -222,6 +248,7 @@ class NodeRegistry:
 
             if not any(n.node_type_name == node_class.__name__ for n in cls._nodes[category]):
                 cls._nodes[category].append(node_info)
+                cls._node_index.setdefault(node_info.node_type_name, node_info)
                 nonlocal registered_tools
                 registered_tools += 1
                 logger.debug(
@@ -244,11 +271,15 @@ class NodeRegistry:
             if not _is_package_dir(path):
                 return
 
-            for item in path.iterdir():
-                if item.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
+            with os.scandir(path) as entries:
+                items = list(entries)
+            for item in items:
+                if item.name.startswith("_"):
+                    continue
+                if item.is_file() and item.name.endswith(".py"):
                     try:
                         # Get the module path relative to project root
-                        module_path = f"{base_package}.{item.stem}"
+                        module_path = f"{base_package}.{item.name[:-3]}"
 
                         # Import the module using standard import_module
                         module = importlib.import_module(module_path)
@@ -262,14 +293,14 @@ class NodeRegistry:
                                 _register_tool_function_node(attr, category)
 
                     except Exception as e:
-                        logger.error(f"Failed to load module {item}: {e}")
+                        logger.error(f"Failed to load module {item.path}: {e}")
                         logger.error(traceback.format_exc())
 
                 # Recursively process subdirectories
-                elif item.is_dir() and not item.name.startswith("_"):
+                elif item.is_dir():
                     # Update the base package for the subdirectory
                     subpackage = f"{base_package}.{item.name}"
-                    _discover_tools_in_directory(item, subpackage)
+                    _discover_tools_in_directory(Path(item.path), subpackage)
 
         # Start recursive discovery from tools directory
         _discover_tools_in_directory(tools_dir)
@@ -4,10 +4,12 @@ import os
 from typing import List, Optional
 
 from exa_py import Exa
-from jinja2 import Template
 from pydantic import BaseModel, Field
 
 from ...base import BaseNode, BaseNodeConfig, BaseNodeInput, BaseNodeOutput
+from ...utils.template_utils import get_template
+
+logger = logging.getLogger(__name__)
 
 
 class ExaSearchNodeInput(BaseNodeInput):
@@ -90,7 +92,7 @@ class ExaSearchNode(BaseNode):
         except ValueError as e:
             if "Unsupported JSON schema type" in str(e):
                 # If we hit schema issues, use a very basic setup
-                logging.warning(f"Schema error: {e}, using simplified approach")
+                logger.warning("Schema error: %s, using simplified approach", e)
 
     async def run(self, input: BaseModel) -> BaseModel:
         try:
@@ -105,9 +107,9 @@ class ExaSearchNode(BaseNode):
             # Extract query from input using the template
             # This approach is more flexible and handles various input field names
             raw_input_dict = input.model_dump()
-            query = Template(self.config.query_template).render(**raw_input_dict)
+            query = get_template(self.config.query_template).render(**raw_input_dict)
 
-            logging.info(f"Executing Exa search with query: {query}")
+            logger.info("Executing Exa search with query: %s", query)
 
             # Configure content options based on config
             content_options = None
@@ -138,5 +140,5 @@ class ExaSearchNode(BaseNode):
             return ExaSearchNodeOutput(results=results)
 
         except Exception as e:
-            logging.error(f"Failed to perform Exa search: {e}")
+            logger.exception("Failed to perform Exa search")
             raise e
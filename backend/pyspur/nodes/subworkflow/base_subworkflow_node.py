@@ -1,13 +1,14 @@
 from abc import ABC
-from typing import Any, Dict, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple, Type
 
-from jinja2 import Template
 from pydantic import BaseModel, Field
 
 from ...execution.workflow_executor import WorkflowExecutor
 from ...schemas.workflow_schemas import WorkflowNodeSchema
 from ...utils.pydantic_utils import get_nested_field
 from ..base import BaseNode, BaseNodeConfig
+from ..utils.template_utils import get_template
 
 
 class BaseSubworkflowNodeConfig(BaseNodeConfig):
@@ -18,6 +19,12 @@ class BaseSubworkflowNodeConfig(BaseNodeConfig):
     )
 
 
+@lru_cache(maxsize=None)
+def _message_field_names(config_model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Return the names of a config model's declared fields that hold message templates."""
+    return tuple(name for name in config_model.model_fields if name.endswith("_message"))
+
+
 class BaseSubworkflowNode(BaseNode, ABC):
     name: str = "static_workflow_node"
     config_model = BaseSubworkflowNodeConfig
@@ -60,9 +67,14 @@ class BaseSubworkflowNode(BaseNode, ABC):
     ) -> BaseSubworkflowNodeConfig:
         """Apply templates to all config fields ending with _message"""
         updates: Dict[str, str] = {}
-        for field_name, value in model.model_dump().items():
-            if isinstance(value, str) and field_name.endswith("_message"):
-                template = Template(value)
+        # Read the message fields directly rather than dumping the whole config
+        field_names = _message_field_names(type(model)) + tuple(
+            name for name in (model.model_extra or {}) if name.endswith("_message")
+        )
+        for field_name in field_names:
+            value = getattr(model, field_name)
+            if isinstance(value, str):
+                template = get_template(value)
                 updates[field_name] = template.render(**input_data)
         if updates:
             return model.model_copy(update=updates)
@@ -78,7 +90,8 @@ class BaseSubworkflowNode(BaseNode, ABC):
         assert self.subworkflow is not None
         if self.subworkflow_output is None:
             self.subworkflow_output = {}
-        mapped_input = self._map_input(input)
+        # Without an input map the subworkflow takes the input as is, already dumped above
+        mapped_input = self._map_input(input) if self.config.input_map else input_dict
         workflow_executor = WorkflowExecutor(workflow=self.subworkflow, context=self.context)
         outputs = await workflow_executor.run(
             mapped_input, precomputed_outputs=self.subworkflow_output
@@ -0,0 +1,20 @@
+import asyncio
+from typing import Awaitable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_with_concurrency(
+    awaitables: Iterable[Awaitable[T]], max_concurrency: int
+) -> List[T]:
+    """Await all awaitables concurrently, running at most max_concurrency at a time.
+
+    Results are returned in the order of the awaitables, like asyncio.gather.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(_bounded(awaitable) for awaitable in awaitables))
@@ -0,0 +1,33 @@
+import asyncio
+from weakref import WeakKeyDictionary
+
+import httpx
+
+# httpx connections are bound to the event loop that opened them, so keep one pooled
+# client per loop rather than a single global one.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled httpx.AsyncClient for the running event loop.
+
+    Reusing the client keeps connections alive between node runs instead of opening a new
+    connection (and TLS handshake) per request. Must be called from inside a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client of the running event loop, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
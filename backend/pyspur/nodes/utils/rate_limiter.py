@@ -0,0 +1,110 @@
+import asyncio
+from collections import deque
+from types import TracebackType
+from typing import Deque, Dict, Optional, Self, Type
+from weakref import WeakKeyDictionary
+
+# Status codes providers use to tell us to slow down
+_RATE_LIMIT_STATUS_CODES = frozenset({429, 503})
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception means the provider is rate limiting us."""
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None) or getattr(error, "status", None)
+    if status_code in _RATE_LIMIT_STATUS_CODES:
+        return True
+    return "rate limit" in str(error).lower()
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit concurrent provider calls, adapting the limit to the provider's feedback.
+
+    The limit follows additive-increase/multiplicative-decrease: every successful call
+    raises it by `increase` (up to `max_limit`), and every rate-limited call multiplies it
+    by `decrease` (down to `min_limit`). Other errors leave the limit unchanged.
+
+    Usage:
+        async with limiter:
+            await call_provider()
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ) -> None:
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease = decrease
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The number of calls currently allowed in flight."""
+        return max(self._min_limit, int(self._limit))
+
+    async def __aenter__(self) -> Self:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Cancelled after being woken: pass the wakeup on, or the slot it was
+                # meant for would be left unused while other callers keep waiting
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self._in_flight -= 1
+        if exc is None:
+            self._limit = min(self._max_limit, self._limit + self._increase)
+        elif is_rate_limit_error(exc):
+            self._limit = max(self._min_limit, self._limit * self._decrease)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        available = self.limit - self._in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+
+# Limiters hold futures of the loop that uses them, so keep one per loop and provider
+_limiters: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AdaptiveConcurrencyLimiter]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_rate_limiter(provider: str, **kwargs: float) -> AdaptiveConcurrencyLimiter:
+    """Return the limiter for a provider on the running event loop.
+
+    Keyword arguments are passed to AdaptiveConcurrencyLimiter when the limiter is first
+    created. Must be called from inside a coroutine.
+    """
+    loop_limiters = _limiters.setdefault(asyncio.get_running_loop(), {})
+    limiter = loop_limiters.get(provider)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(**kwargs)  # type: ignore
+        loop_limiters[provider] = limiter
+    return limiter
@@ -0,0 +1,67 @@
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+import requests
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+T = TypeVar("T")
+
+# Status codes worth retrying: timeouts, rate limits and temporary server errors
+_TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+_TRANSIENT_MESSAGES = ("rate limit", "quota", "timeout", "timed out")
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Check whether a provider call failed for a reason that is likely to go away."""
+    if isinstance(error, (httpx.TransportError, requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) in _TRANSIENT_STATUS_CODES:
+        return True
+    message = str(error).lower()
+    return any(keyword in message for keyword in _TRANSIENT_MESSAGES)
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as the provider's Retry-After header asks, else back off with jitter."""
+    outcome = retry_state.outcome
+    error = outcome.exception() if outcome is not None else None
+    response = getattr(error, "response", None)
+    retry_after = getattr(response, "headers", {}).get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), _MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            pass  # HTTP-date values fall back to the exponential backoff
+    return _backoff(retry_state)
+
+
+def retry_transient_errors(f: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Retry an async provider call up to three times on transient errors.
+
+    Other errors, and the last transient one, are raised to the caller unchanged.
+    """
+
+    @functools.wraps(f)
+    async def wrapped_f(*args: Any, **kwargs: Any) -> T:
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(is_transient_error),
+            wait=_wait_for_retry,
+            stop=stop_after_attempt(3),
+            reraise=True,
+        ):
+            with attempt:
+                return await f(*args, **kwargs)
+        raise AssertionError("unreachable")  # AsyncRetrying either returns or raises
+
+    return wrapped_f
@@ -1,7 +1,123 @@
 import logging
-from typing import Any, Dict
+import os
+import stat
+import types
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Literal, Optional, Tuple, Type, Union, get_args, get_origin
 
-from jinja2 import Template
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FunctionLoader,
+    Template,
+    meta,
+)
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def _get_bytecode_cache() -> Optional[BytecodeCache]:
+    """Return the on-disk bytecode cache, unless PYSPUR_JINJA_BYTECODE_CACHE disables it.
+
+    Compiled templates are kept in PYSPUR_JINJA_BYTECODE_CACHE_DIR, or in a per-user
+    temporary directory picked by Jinja, so restarted workers skip the compile step.
+    """
+    if os.getenv("PYSPUR_JINJA_BYTECODE_CACHE", "true").lower() in ("false", "0", "no"):
+        return None
+    directory = os.getenv("PYSPUR_JINJA_BYTECODE_CACHE_DIR")
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Cached bytecode is loaded with marshal and executed, so a directory that other
+        # users can write to would let them run code in this process
+        if os.name == "posix":
+            st = os.stat(directory)
+            if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                logger.warning(
+                    "Not caching Jinja bytecode in %s: the directory must be owned by this "
+                    "user and not writable by group or others",
+                    directory,
+                )
+                return None
+    return FileSystemBytecodeCache(directory)
+
+
+# One environment shared by every template we render. Its settings match the defaults
+# jinja2.Template uses, so templates render exactly as they did when built standalone.
+# Templates are loaded by their own source, because Jinja only consults the bytecode
+# cache for templates that come from a loader, not for Environment.from_string.
+TEMPLATE_ENV = Environment(
+    loader=FunctionLoader(lambda template_str: template_str),
+    bytecode_cache=_get_bytecode_cache(),
+    auto_reload=False,
+)
+
+
+@lru_cache(maxsize=256)
+def get_template(template_str: str) -> Template:
+    """Return the compiled Jinja2 template for a template string.
+
+    Parsing and compiling a template is far more expensive than rendering it, and node
+    templates come from the node config, so they are compiled once and reused.
+    The lru_cache skips the loader lookup, and the bytecode cache skips compiling
+    templates that an earlier worker process already compiled.
+    """
+    return TEMPLATE_ENV.get_template(template_str)
+
+
+@lru_cache(maxsize=256)
+def get_template_variables(template_str: str) -> FrozenSet[str]:
+    """Return the names of the variables a template string reads from its context."""
+    return frozenset(meta.find_undeclared_variables(TEMPLATE_ENV.parse(template_str)))
+
+
+def get_template_context(input: BaseModel, template_str: Optional[str] = None) -> Dict[str, Any]:
+    """Return a node input's fields as a template context.
+
+    If a non-empty template_str is given, only the fields that template reads are dumped,
+    so the rest of the input is not copied. The dumped fields are the same dicts a full
+    model_dump() gives, so templates render as before.
+    """
+    if template_str is None or not template_str.strip():
+        return input.model_dump()
+    return input.model_dump(include=set(get_template_variables(template_str)))
+
+
+def _can_hold_string(annotation: Any) -> bool:
+    """Return whether a field with this annotation may hold a str value."""
+    if annotation is None or annotation is Any:
+        return True
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return any(_can_hold_string(arg) for arg in get_args(annotation))
+    if origin is Literal:
+        return any(isinstance(arg, str) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, str)
+
+
+@lru_cache(maxsize=256)
+def _string_field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Return the names of a model's fields that may hold a str, in declaration order."""
+    return tuple(
+        name for name, field in model.model_fields.items() if _can_hold_string(field.annotation)
+    )
+
+
+def get_first_string(input: BaseModel) -> Optional[str]:
+    """Return the first str value of a node input, or None if it has none.
+
+    Only the fields whose type allows a str are checked, followed by any extra fields,
+    so the input is never copied into a dict.
+    """
+    for name in _string_field_names(type(input)):
+        value = getattr(input, name)
+        if isinstance(value, str):
+            return value
+    for value in (input.__pydantic_extra__ or {}).values():
+        if isinstance(value, str):
+            return value
+    return None
 
 
 def render_template_or_get_first_string(
@@ -23,19 +139,16 @@ def render_template_or_get_first_string(
         ValueError: If no string value is found in input when template is empty
     """
     try:
-        # Render template
-        rendered = Template(template_str).render(**input_dict)
-
-        # If template is empty, find first string value
+        # If template is empty, find first string value without rendering anything
         if not template_str.strip():
-            for _, value in input_dict.items():
-                if isinstance(value, str):
-                    return value
-            raise ValueError(f"No string type found in the input dictionary: {input_dict}")
+            value = next((v for v in input_dict.values() if isinstance(v, str)), None)
+            if value is None:
+                raise ValueError(f"No string type found in the input dictionary: {input_dict}")
+            return value
 
-        return rendered
+        return get_template(template_str).render(**input_dict)
 
     except Exception as e:
-        logging.error(f"Failed to render template in {node_name}")
-        logging.error(f"template: {template_str} with input: {input_dict}")
+        logger.exception("Failed to render template in %s", node_name)
+        logger.error("template: %s with input: %s", template_str, input_dict)
         raise e
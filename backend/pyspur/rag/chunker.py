@@ -1,12 +1,14 @@
 import os
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import BinaryIO, Dict, List, Tuple
 
 import tiktoken
-from jinja2 import Template
 
+from ..nodes.llm._utils import get_litellm
+from ..nodes.utils.template_utils import get_template
 from .parser import extract_text_from_file
 from .schemas.document_schemas import (
     ChunkingConfigSchema,
@@ -15,8 +17,16 @@ from .schemas.document_schemas import (
     DocumentSchema,
 )
 
-# Global variables
-tokenizer = tiktoken.get_encoding("cl100k_base")  # The encoding scheme to use for tokenization
+
+@lru_cache(maxsize=None)
+def get_tokenizer() -> tiktoken.Encoding:
+    """Return the cl100k_base tokenizer used for chunking, loaded on first use.
+
+    litellm ships this encoding and points tiktoken at its copy, so litellm is loaded first
+    and the encoding is read from disk instead of being downloaded.
+    """
+    get_litellm()
+    return tiktoken.get_encoding("cl100k_base")
 
 
 def apply_template(
@@ -31,13 +41,13 @@ def apply_template(
         }
 
         # Process text template
-        text_template = Template(template)
+        text_template = get_template(template)
         processed_text = text_template.render(**context)
 
         # Process metadata templates
         processed_metadata: Dict[str, str] = {}
         for key, template_str in metadata_template.items():
-            metadata_template_obj = Template(template_str)
+            metadata_template_obj = get_template(template_str)
             processed_metadata[key] = metadata_template_obj.render(**context)
 
         return processed_text, processed_metadata
@@ -61,6 +71,7 @@ def get_text_chunks(text: str, config: ChunkingConfigSchema) -> List[str]:
     if not text or text.isspace():
         return []
 
+    tokenizer = get_tokenizer()
     tokens = tokenizer.encode(text, disallowed_special=())
     chunks: List[str] = []
     num_chunks = 0
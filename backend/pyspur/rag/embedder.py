@@ -1,15 +1,17 @@
+import asyncio
 import logging
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, TypeAlias, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeAlias, Union
 
 import numpy as np
 import numpy.typing as npt
-from litellm import aembedding
-from litellm.types.utils import EmbeddingResponse
 from pydantic import BaseModel, Field
 from tenacity import stop_after_attempt, wait_random_exponential
 
-from ..nodes.llm._utils import async_retry
+from ..nodes.llm._utils import async_retry, get_litellm
+
+if TYPE_CHECKING:
+    from litellm.types.utils import EmbeddingResponse
 
 EmbeddingArray: TypeAlias = npt.NDArray[np.float32]
 EmbeddingData = Dict[str, List[float]]
@@ -266,7 +268,7 @@ async def get_single_text_embedding(
                 )
             kwargs["encoding_format"] = encoding_format
 
-        response = await aembedding(**kwargs)
+        response = await get_litellm().aembedding(**kwargs)
         return response.data[0]["embedding"]
 
     except Exception as e:
@@ -331,7 +333,7 @@ async def get_multiple_text_embeddings(
             logging.debug(f"[DEBUG] First text in batch (truncated): {batch[0][:100]}...")
             logging.debug(f"[DEBUG] Using model: {model}")
 
-            response: EmbeddingResponse = await aembedding(**kwargs)
+            response: EmbeddingResponse = await get_litellm().aembedding(**kwargs)
             batch_embeddings: List[List[float]] = [item["embedding"] for item in response.data]
             all_embeddings.extend(batch_embeddings)
             logging.debug(f"[DEBUG] Batch embeddings length: {len(batch_embeddings)}")
@@ -376,21 +378,19 @@ async def find_top_k_similar_documents(
     encoding_format: Optional[CohereEncodingFormat] = None,
 ) -> Dict[Any, List[Dict[str, Any]]]:
     """Find top k similar documents from candidate_docs for each query doc."""
-    query_embeddings: EmbeddingArray = await get_multiple_text_embeddings(
-        query_docs,
-        model=model,
-        dimensions=dimensions,
-        text_extractor=text_extractor,
-        api_key=api_key,
-        encoding_format=encoding_format,
-    )
-    candidate_embeddings: EmbeddingArray = await get_multiple_text_embeddings(
-        candidate_docs,
-        model=model,
-        dimensions=dimensions,
-        text_extractor=text_extractor,
-        api_key=api_key,
-        encoding_format=encoding_format,
+    # The two embedding requests are independent, so issue them concurrently
+    query_embeddings, candidate_embeddings = await asyncio.gather(
+        *(
+            get_multiple_text_embeddings(
+                docs,
+                model=model,
+                dimensions=dimensions,
+                text_extractor=text_extractor,
+                api_key=api_key,
+                encoding_format=encoding_format,
+            )
+            for docs in (query_docs, candidate_docs)
+        )
     )
 
     similarity_matrix = cosine_similarity(query_embeddings, candidate_embeddings)
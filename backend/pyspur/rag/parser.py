@@ -10,7 +10,6 @@ import pptx
 from fastapi import UploadFile
 from loguru import logger
 from pypdf import PdfReader
-from pyzerox import zerox
 
 from .schemas.document_schemas import DocumentMetadataSchema, DocumentSchema
 
@@ -165,6 +164,9 @@ async def extract_text_with_vision_model(
     elif provider == "vertex_ai" and api_key:
         kwargs = {"vertex_credentials": api_key}
 
+    # pyzerox loads litellm, which is slow to import, so it is only imported when used
+    from pyzerox import zerox
+
     try:
         # Process the document with zerox
         result = await zerox(
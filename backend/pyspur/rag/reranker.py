@@ -2,11 +2,10 @@ import logging
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
-from litellm import arerank
 from pydantic import BaseModel, Field
 from tenacity import stop_after_attempt, wait_random_exponential
 
-from ..nodes.llm._utils import async_retry
+from ..nodes.llm._utils import async_retry, get_litellm
 
 
 class RerankerProvider(str, Enum):
@@ -92,7 +91,7 @@ async def rerank_documents_by_query(
             if api_key:
                 kwargs["api_key"] = api_key
 
-            response = await arerank(**kwargs)
+            response = await get_litellm().arerank(**kwargs)
 
             # Process results
             batch_results = []
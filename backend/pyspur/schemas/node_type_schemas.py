@@ -1,8 +1,41 @@
 import importlib
+import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
 
 from pydantic import BaseModel
 
 
+def import_node_module(module_name: str) -> ModuleType:
+    """Import a node module given relative to the pyspur package (or as an absolute path).
+
+    Node modules are almost always imported already, so check sys.modules before going
+    through the import machinery.
+    """
+    qualified_name = f"pyspur{module_name}" if module_name.startswith(".") else module_name
+    module = sys.modules.get(qualified_name)
+    if module is None:
+        module = importlib.import_module(module_name, package="pyspur")
+    return module
+
+
+@lru_cache(maxsize=None)
+def resolve_node_class(module_name: str, class_name: str) -> Any:
+    """Resolve a (possibly dotted) class name inside a node module.
+
+    Node classes never change once imported, so the result is cached per module/class pair.
+    """
+    # Start with the module
+    obj: Any = import_node_module(module_name)
+
+    # Traverse the attribute chain
+    for part in class_name.split("."):
+        obj = getattr(obj, part)
+
+    return obj
+
+
 class NodeTypeSchema(BaseModel):
     node_type_name: str
     class_name: str
@@ -10,20 +43,7 @@ class NodeTypeSchema(BaseModel):
 
     @property
     def node_class(self):
-        # Import the module
-        module = importlib.import_module(name=f"{self.module}", package="pyspur")
-
-        # Split the class name into parts for attribute traversal
-        parts = self.class_name.split(".")
-
-        # Start with the module
-        obj = module
-
-        # Traverse the attribute chain
-        for part in parts:
-            obj = getattr(obj, part)
-
-        return obj
+        return resolve_node_class(self.module, self.class_name)
 
     @property
     def input_model(self):
@@ -1,7 +1,45 @@
+import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel, Field, create_model
 
+# JSON schema types that map straight to a python type, and to a simple schema type name
+_JSON_SCHEMA_SCALAR_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+_JSON_SCHEMA_TYPE_TO_SIMPLE_TYPE: Dict[str, str] = {
+    "object": "dict",
+    "array": "list",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "string": "string",
+}
+
+
+@lru_cache(maxsize=1024)
+def _list_of(item_type: Any) -> Any:
+    """Return ``List[item_type]``, reusing the generic alias for repeated item types."""
+    return List[item_type]
+
+
+@lru_cache(maxsize=512)
+def _model_json_schema_str(model: Type[BaseModel]) -> str:
+    return json.dumps(model.model_json_schema())
+
+
+def get_model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Return the JSON schema of a model class.
+
+    Generating a schema walks every field of the model, so it is done once per model and
+    cached serialized; each call gets a fresh dict that the caller is free to modify.
+    """
+    return json.loads(_model_json_schema_str(model))
+
 
 def get_nested_field(field_name_with_dots: str, model: BaseModel) -> Any:
     """Get the value of a nested field from a Pydantic model."""
@@ -106,19 +144,13 @@ def json_schema_to_pydantic_type(json_schema: Dict[str, Any], definitions: Dict[
     if ref := json_schema.get('$ref'):
         return definitions[ref.split("/")[-1]]
 
-    if type_ == "string":
-        return str
-    elif type_ == "integer":
-        return int
-    elif type_ == "number":
-        return float
-    elif type_ == "boolean":
-        return bool
+    if isinstance(type_, str) and type_ in _JSON_SCHEMA_SCALAR_TYPES:
+        return _JSON_SCHEMA_SCALAR_TYPES[type_]
     elif type_ == "array":
         items_schema = json_schema.get("items")
         if items_schema:
             item_type = json_schema_to_pydantic_type(items_schema, definitions)
-            return List[item_type]
+            return _list_of(item_type)
         else:
             return List
     elif type_ == "object":
@@ -151,18 +183,8 @@ def json_schema_to_simple_schema(json_schema: Dict[str, Any]) -> Dict[str, str]:
 
     for prop, prop_details in json_schema.get("properties", {}).items():
         prop_type = prop_details.get("type")
-        if prop_type == "object":
-            simple_schema[prop] = "dict"
-        elif prop_type == "array":
-            simple_schema[prop] = "list"
-        elif prop_type == "integer":
-            simple_schema[prop] = "int"
-        elif prop_type == "number":
-            simple_schema[prop] = "float"
-        elif prop_type == "boolean":
-            simple_schema[prop] = "bool"
-        elif prop_type == "string":
-            simple_schema[prop] = "string"
+        if isinstance(prop_type, str) and prop_type in _JSON_SCHEMA_TYPE_TO_SIMPLE_TYPE:
+            simple_schema[prop] = _JSON_SCHEMA_TYPE_TO_SIMPLE_TYPE[prop_type]
         else:
             simple_schema[prop] = "Any"
     return simple_schema
@@ -1,5 +1,4 @@
 import asyncio
-import atexit
 import hashlib
 import json
 import os
@@ -0,0 +1,103 @@
+"""Tests for the rate_limiter.py module in the PySpur nodes utils."""
+
+import asyncio
+
+import pytest
+
+from pyspur.nodes.utils.rate_limiter import AdaptiveConcurrencyLimiter, is_rate_limit_error
+
+
+class RateLimitError(Exception):
+    """Stand-in for a provider error carrying a 429 status."""
+
+    status = 429
+
+
+def test_is_rate_limit_error() -> None:
+    """Test recognizing rate limit errors by status code and message."""
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(Exception("Rate limit exceeded"))
+    assert not is_rate_limit_error(ValueError("bad request"))
+
+
+def test_limiter_grows_on_success() -> None:
+    """Test that successful calls raise the limit up to max_limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, increase=0.5)
+
+    async def run() -> None:
+        for _ in range(4):
+            async with limiter:
+                pass
+
+    asyncio.run(run())
+    assert limiter.limit == 3
+
+
+def test_limiter_backs_off_on_rate_limit() -> None:
+    """Test that rate-limited calls shrink the limit down to min_limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, decrease=0.5)
+
+    async def run() -> None:
+        for _ in range(3):
+            with pytest.raises(RateLimitError):
+                async with limiter:
+                    raise RateLimitError()
+
+    asyncio.run(run())
+    assert limiter.limit == 2
+
+
+def test_limiter_keeps_limit_on_other_errors() -> None:
+    """Test that errors other than rate limiting leave the limit unchanged."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+    async def run() -> None:
+        with pytest.raises(ValueError):
+            async with limiter:
+                raise ValueError()
+
+    asyncio.run(run())
+    assert limiter.limit == 4
+
+
+def test_limiter_caps_calls_in_flight() -> None:
+    """Test that no more than limit calls run at the same time."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    in_flight = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal in_flight, peak
+        async with limiter:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def run() -> None:
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_limiter_passes_on_wakeup_of_cancelled_waiter() -> None:
+    """Test that a waiter cancelled right after being woken does not strand the others."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+    async def waiter() -> None:
+        async with limiter:
+            pass
+
+    async def run() -> None:
+        async with limiter:
+            waiter_a = asyncio.create_task(waiter())
+            waiter_b = asyncio.create_task(waiter())
+            await asyncio.sleep(0)
+        # Leaving the block woke A; cancel it before it gets to run
+        waiter_a.cancel()
+
+        await asyncio.wait_for(waiter_b, timeout=1)
+        assert waiter_a.cancelled()
+
+    asyncio.run(run())